@@ -13,15 +13,33 @@ Handles:
 - External services (Stripe)
 """
 
+import json
 import uuid
 import logging
 from datetime import datetime
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import CharField, Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Concat, Left, MD5
 from django.contrib.auth.models import User
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def format_json(data):
+    """
+    Pretty-print a GDPR summary or deletion result as JSON.
+    Uses orjson when installed, which is much faster on large summaries.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(data, indent=2, default=str)
+
 
 class GDPRDeletionService:
     """
@@ -33,6 +51,30 @@ class GDPRDeletionService:
         """Generate an anonymized email address"""
         return f"deleted-{uuid.uuid4().hex[:16]}@deleted.invalid"
 
+    @staticmethod
+    def _anonymized_email_expression():
+        """
+        Database expression producing an anonymized email per row, in the same
+        format as _generate_anonymized_email. A random salt keeps the result
+        from being derivable from the row ID.
+        """
+        salt = uuid.uuid4().hex
+        return Concat(
+            Value('deleted-'),
+            Left(MD5(Concat(Value(salt), Cast('pk', output_field=CharField()))), 16),
+            Value('@deleted.invalid'),
+            output_field=CharField(),
+        )
+
+    @staticmethod
+    def _reviewee_count_subquery(queryset):
+        """
+        Scalar subquery counting the rows of queryset that belong to the outer
+        Reviewee (queryset must filter on cycle__reviewee=OuterRef('pk')).
+        """
+        counts = queryset.order_by().values('cycle__reviewee').annotate(count=Count('pk')).values('count')
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
     @staticmethod
     def _generate_anonymized_name():
         """Generate an anonymized name"""
@@ -43,6 +85,10 @@ class GDPRDeletionService:
         """
         Log deletion event for audit trail.
 
+        The trail is one logger record per deleted entity, not per affected row,
+        so bulk deletions are not bound by audit writes. If it ever moves to a
+        database table, buffer the rows and write them with a single COPY.
+
         Args:
             entity_type: Type of entity deleted (User, Reviewee, etc.)
             entity_id: ID of the deleted entity
@@ -191,8 +237,120 @@ class GDPRDeletionService:
         return result
 
     @staticmethod
-    @transaction.atomic
-    def delete_reviewee(reviewee_id, hard_delete=False, performed_by=None):
+    def _hard_delete_reviewee_fast(reviewee_id, chunk_size=None):
+        """
+        Delete a reviewee and all of its review data bottom-up, one DELETE per table.
+
+        The ORM cascade loads every child row into Python before deleting it;
+        here each child table is filtered on its (indexed) FK column against the
+        reviewee's cycles instead. Nothing else references these tables and no
+        delete signals are registered for them, so skipping the collector is safe.
+
+        With chunk_size, each table is deleted at most chunk_size rows per
+        statement, each in its own transaction (a savepoint if the caller holds
+        one), so row locks and WAL are bounded per chunk. Otherwise the caller
+        must provide the transaction.
+
+        Args:
+            reviewee_id: ID of the Reviewee to delete
+            chunk_size: Maximum rows per DELETE statement (None for one statement per table)
+
+        Returns:
+            dict: Rows deleted per table
+        """
+        from accounts.models import Reviewee
+        from reviews.models import ReviewCycle, ReviewerToken, Response
+        from reports.models import Report
+
+        quote_name = connection.ops.quote_name
+        cycle_ids = (
+            f'SELECT {quote_name("id")} FROM {quote_name(ReviewCycle._meta.db_table)} '
+            f'WHERE {quote_name("reviewee_id")} = %s'
+        )
+
+        # Children first, so no FK constraint is ever violated
+        stages = [
+            (Report, f'{quote_name("cycle_id")} IN ({cycle_ids})'),
+            (Response, f'{quote_name("cycle_id")} IN ({cycle_ids})'),
+            (ReviewerToken, f'{quote_name("cycle_id")} IN ({cycle_ids})'),
+            (ReviewCycle, f'{quote_name("reviewee_id")} = %s'),
+            (Reviewee, f'{quote_name("id")} = %s'),
+        ]
+
+        deleted_counts = {}
+        with connection.cursor() as cursor:
+            for model, condition in stages:
+                table = model._meta.db_table
+
+                if chunk_size is None:
+                    cursor.execute(f'DELETE FROM {quote_name(table)} WHERE {condition}', [reviewee_id])
+                    deleted_counts[table] = cursor.rowcount
+                else:
+                    deleted_counts[table] = 0
+                    chunk_sql = (
+                        f'DELETE FROM {quote_name(table)} WHERE {quote_name("id")} IN ('
+                        f'SELECT {quote_name("id")} FROM {quote_name(table)} WHERE {condition} LIMIT %s)'
+                    )
+                    while True:
+                        with transaction.atomic():
+                            cursor.execute(chunk_sql, [reviewee_id, chunk_size])
+                            deleted = cursor.rowcount
+                        deleted_counts[table] += deleted
+                        if deleted < chunk_size:
+                            break
+
+                logger.info(f"GDPR hard delete Reviewee {reviewee_id}: {deleted_counts[table]} rows from {table}")
+
+        return deleted_counts
+
+    @staticmethod
+    def _truncate_review_data_if_sole_owner(reviewee_id):
+        """
+        TRUNCATE the review tables when every review cycle in the database
+        belongs to this reviewee (e.g. wiping a single-tenant install).
+
+        TRUNCATE frees the tables in constant time instead of deleting and
+        logging each row, and RESTART IDENTITY resets their sequences. The tables
+        are locked before checking ownership so no other reviewee's cycle can
+        appear in between. Must run inside a transaction; PostgreSQL only.
+
+        Args:
+            reviewee_id: ID of the Reviewee being hard deleted
+
+        Returns:
+            bool: True if the tables were truncated, False if other reviewees
+            own review data (or the database is not PostgreSQL)
+        """
+        from reviews.models import ReviewCycle, ReviewerToken, Response
+        from reports.models import Report
+
+        if connection.vendor != 'postgresql':
+            return False
+
+        quote_name = connection.ops.quote_name
+        tables = ', '.join(
+            quote_name(model._meta.db_table)
+            for model in (Report, Response, ReviewerToken, ReviewCycle)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'LOCK TABLE {tables} IN ACCESS EXCLUSIVE MODE')
+            cursor.execute(
+                f'SELECT 1 FROM {quote_name(ReviewCycle._meta.db_table)} '
+                f'WHERE {quote_name("reviewee_id")} != %s LIMIT 1',
+                [reviewee_id]
+            )
+            if cursor.fetchone():
+                return False
+
+            # No CASCADE: fail loudly if some other table starts referencing these
+            cursor.execute(f'TRUNCATE {tables} RESTART IDENTITY')
+
+        logger.info(f"GDPR hard delete Reviewee {reviewee_id}: truncated {tables}")
+        return True
+
+    @staticmethod
+    def delete_reviewee(reviewee_id, hard_delete=False, performed_by=None, chunk_size=None, purge=False):
         """
         Delete or anonymize a Reviewee and related feedback data.
 
@@ -200,6 +358,10 @@ class GDPRDeletionService:
             reviewee_id: ID of the Reviewee to delete
             hard_delete: If True, completely delete. If False (default), anonymize.
             performed_by: User performing the deletion (for audit trail)
+            chunk_size: For hard deletes, delete at most this many rows per
+                transaction instead of everything in one transaction
+            purge: For hard deletes, TRUNCATE the review tables instead when
+                this reviewee owns every review cycle in the database
 
         Returns:
             dict: Summary of deletion actions
@@ -207,6 +369,18 @@ class GDPRDeletionService:
         Raises:
             Reviewee.DoesNotExist: If reviewee not found
         """
+        if hard_delete and chunk_size:
+            # Chunks commit as they go, so locks are released during the delete.
+            # Children are removed first, so an interrupted run leaves consistent
+            # data and can simply be repeated.
+            return GDPRDeletionService._delete_reviewee(reviewee_id, hard_delete, performed_by, chunk_size)
+
+        with transaction.atomic():
+            return GDPRDeletionService._delete_reviewee(reviewee_id, hard_delete, performed_by, purge=purge)
+
+    @staticmethod
+    def _delete_reviewee(reviewee_id, hard_delete, performed_by, chunk_size=None, purge=False):
+        """Implementation of delete_reviewee; see there for arguments"""
         from accounts.models import Reviewee
         from reviews.models import ReviewCycle
 
@@ -230,9 +404,11 @@ class GDPRDeletionService:
 
         if hard_delete:
             # Hard delete: Complete removal
-            # Note: CASCADE will handle ReviewCycle, ReviewerToken, Response, Report automatically
-
-            reviewee.delete()
+            # Related review cycles, tokens, responses and reports are removed with one
+            # set-based DELETE per table instead of the ORM collector's cascade.
+            if purge:
+                result['truncated'] = GDPRDeletionService._truncate_review_data_if_sole_owner(reviewee_id)
+            result['deleted_counts'] = GDPRDeletionService._hard_delete_reviewee_fast(reviewee_id, chunk_size)
             result['status'] = 'deleted'
             result['cascade_note'] = 'All related review cycles, tokens, responses, and reports deleted'
 
@@ -282,13 +458,16 @@ class GDPRDeletionService:
         logger.info(f"Starting full anonymization delete for Reviewee {reviewee_id}")
 
         # First, anonymize all reviewer emails in tokens for this reviewee's cycles
-        reviewer_tokens = ReviewerToken.objects.filter(cycle__reviewee=reviewee)
-        token_count = reviewer_tokens.count()
-
-        for token in reviewer_tokens:
-            if token.reviewer_email:
-                token.reviewer_email = GDPRDeletionService._generate_anonymized_email()
-                token.save()
+        # in one UPDATE, letting the database derive a distinct address per token
+        token_count = ReviewerToken.objects.filter(
+            cycle__reviewee=reviewee
+        ).exclude(
+            reviewer_email__isnull=True
+        ).exclude(
+            reviewer_email=''
+        ).update(
+            reviewer_email=GDPRDeletionService._anonymized_email_expression()
+        )
 
         # Then anonymize the reviewee
         result = GDPRDeletionService.delete_reviewee(
@@ -422,11 +601,19 @@ class GDPRDeletionService:
             dict: Summary of reviewee's data
         """
         from accounts.models import Reviewee
-        from reviews.models import ReviewCycle, ReviewerToken, Response
+        from reviews.models import ReviewerToken, Response
         from reports.models import Report
 
-        reviewee = Reviewee.objects.get(pk=reviewee_id)
-        cycles = ReviewCycle.objects.filter(reviewee=reviewee)
+        # Fetch the reviewee, its organization and every count in one query
+        count_subquery = GDPRDeletionService._reviewee_count_subquery
+        reviewee = Reviewee.objects.select_related('organization').annotate(
+            cycles_total=Count('review_cycles'),
+            cycles_active=Count('review_cycles', filter=Q(review_cycles__status='active')),
+            cycles_completed=Count('review_cycles', filter=Q(review_cycles__status='completed')),
+            token_count=count_subquery(ReviewerToken.objects.filter(cycle__reviewee=OuterRef('pk'))),
+            response_count=count_subquery(Response.objects.filter(cycle__reviewee=OuterRef('pk'))),
+            report_count=count_subquery(Report.objects.filter(cycle__reviewee=OuterRef('pk'))),
+        ).get(pk=reviewee_id)
 
         summary = {
             'reviewee': {
@@ -438,13 +625,13 @@ class GDPRDeletionService:
                 'is_active': reviewee.is_active,
             },
             'review_cycles': {
-                'total': cycles.count(),
-                'active': cycles.filter(status='active').count(),
-                'completed': cycles.filter(status='completed').count(),
+                'total': reviewee.cycles_total,
+                'active': reviewee.cycles_active,
+                'completed': reviewee.cycles_completed,
             },
-            'tokens': ReviewerToken.objects.filter(cycle__reviewee=reviewee).count(),
-            'responses': Response.objects.filter(cycle__reviewee=reviewee).count(),
-            'reports': Report.objects.filter(cycle__reviewee=reviewee).count(),
+            'tokens': reviewee.token_count,
+            'responses': reviewee.response_count,
+            'reports': reviewee.report_count,
         }
 
         return summary
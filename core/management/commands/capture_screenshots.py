@@ -8,7 +8,222 @@ from django.conf import settings
 import json
 import os
 import asyncio
+import hashlib
+import tempfile
+import time
+from collections import Counter
 from pathlib import Path
+from urllib.parse import urlsplit
+
+
+# Playwright contexts only release memory when closed, so each context is
+# replaced by a fresh one after this many captures
+CONTEXT_RECYCLE_AFTER = 10
+
+
+# Third-party hosts the pages need to render as in production (web fonts,
+# e.g. the Roboto import in components/agency_levels_svg.html)
+RENDER_HOSTS = frozenset({'fonts.googleapis.com', 'fonts.gstatic.com'})
+
+# Seconds a saved login session is reused before logging in again
+SESSION_CACHE_TTL = 60 * 60
+
+# Per-theme init scripts: set the theme and dismiss the welcome modal
+INIT_SCRIPTS = {
+    theme: (
+        f"localStorage.setItem('theme', '{theme}');"
+        "localStorage.setItem('blik_welcome_seen', 'true');"
+    )
+    for theme in ('light', 'dark')
+}
+
+# Resolves once every web font has loaded
+FONTS_READY_JS = '() => document.fonts.ready.then(() => true)'
+
+# True once all canvases have a 2d context and Chart.js has no running animation
+CHARTS_SETTLED_JS = """() => {
+    const canvases = document.querySelectorAll('canvas');
+    if (canvases.length === 0 ||
+        !Array.from(canvases).every(c => c.getContext('2d') !== null)) {
+        return false;
+    }
+    if (!window.Chart || !Chart.instances || !Chart.animator) {
+        return true;
+    }
+    return Object.values(Chart.instances).every(chart => !Chart.animator.running(chart));
+}"""
+
+# Two animation frames guarantee the last DOM change has been laid out and painted
+NEXT_PAINT_JS = '() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))'
+
+# Scroll an element into position in one call, reading its layout once before
+# writing the scroll offset, then wait for the paint:
+# 'start' = top of element aligned to top of viewport
+# 'center' = element centered in viewport
+# 'end' = bottom of element aligned to bottom of viewport
+SCROLL_TO_ELEMENT_JS = """([selector, position]) => {
+    const element = document.querySelector(selector);
+    if (!element) {
+        return false;
+    }
+    const rect = element.getBoundingClientRect();
+    const top = rect.top + window.pageYOffset;
+    let y = top;
+    if (position === 'center') {
+        y = top - (window.innerHeight / 2) + (rect.height / 2);
+    } else if (position === 'end') {
+        y = top + rect.height - window.innerHeight;
+    }
+    window.scrollTo(0, y);
+    return new Promise(r => requestAnimationFrame(() => requestAnimationFrame(() => r(true))));
+}"""
+
+# Prepared pages waiting for the screenshot stage of the capture pipeline
+PIPELINE_DEPTH = 2
+
+# Static assets served from the in-process cache after their first download
+STATIC_ASSET_PATTERN = '**/*.{css,js,woff2,woff,ttf,png,jpg,jpeg,svg,webp,gif}'
+
+
+class AssetCache:
+    """
+    In-process cache of static asset responses shared by all browser contexts.
+
+    Playwright contexts don't share an HTTP cache, so without this every
+    screenshot re-downloads the same CSS, JS, fonts and images.
+    """
+
+    def __init__(self):
+        self.responses = {}
+
+    async def handle(self, route):
+        url = route.request.url
+        cached = self.responses.get(url)
+        if cached is None:
+            response = await route.fetch()
+            body = await response.body()
+            cached = (response.status, response.headers, body)
+            if response.ok:
+                self.responses[url] = cached
+
+        status, headers, body = cached
+        await route.fulfill(status=status, headers=headers, body=body)
+
+
+class ThirdPartyBlocker:
+    """
+    Abort every request that doesn't go to the application being captured
+    or to one of RENDER_HOSTS.
+
+    Analytics and tracker requests don't change what the screenshot shows
+    but do hold up networkidle. Web fonts do change it, so those hosts are
+    let through.
+    """
+
+    def __init__(self, base_url):
+        self.origin = self._origin(base_url)
+
+    @staticmethod
+    def _origin(url):
+        parts = urlsplit(url)
+        return (parts.scheme, parts.netloc)
+
+    async def handle(self, route):
+        url = route.request.url
+        if (url.startswith(('data:', 'blob:')) or self._origin(url) == self.origin
+                or urlsplit(url).hostname in RENDER_HOSTS):
+            await route.fallback()
+        else:
+            await route.abort()
+
+
+class PagePool:
+    """
+    Pool of pre-warmed Playwright pages, one queue per browser context.
+
+    Pages are rented for a single capture and blanked before being returned,
+    so the page creation/teardown cost is paid once per pool slot instead of
+    once per screenshot. After `recycle_after` captures a context is retired
+    and replaced by a fresh one from `context_factory`, bounding Chromium's
+    memory growth on long runs.
+    """
+
+    def __init__(self, context_factory, sizes, recycle_after=CONTEXT_RECYCLE_AFTER):
+        self.context_factory = context_factory
+        self.sizes = sizes
+        self.recycle_after = recycle_after
+        self.contexts = {}
+        self.queues = {}
+        self.uses = {}
+        self.rented = {}
+        self.lock = asyncio.Lock()
+
+    async def warm(self):
+        """Open a context per key and pre-create its pages"""
+        for key in self.sizes:
+            await self._open(key)
+
+    async def _open(self, key):
+        context = await self.context_factory(key)
+        queue = asyncio.Queue()
+        for _ in range(self.sizes[key]):
+            queue.put_nowait(await context.new_page())
+        self.contexts[key] = context
+        self.queues[key] = queue
+        self.uses[key] = 0
+        self.rented[context] = 0
+
+    async def _retire(self, key):
+        context = self.contexts.pop(key)
+        queue = self.queues.pop(key)
+        while not queue.empty():
+            await queue.get_nowait().close()
+        # Pages still rented out are closed on release
+        if self.rented[context] == 0:
+            del self.rented[context]
+            await context.close()
+
+    async def acquire(self, key):
+        async with self.lock:
+            if self.uses[key] >= self.recycle_after:
+                await self._retire(key)
+                await self._open(key)
+            self.uses[key] += 1
+            context = self.contexts[key]
+            queue = self.queues[key]
+            # Grow the pool rather than wait when every page is rented out
+            page = queue.get_nowait() if not queue.empty() else await context.new_page()
+            self.rented[context] += 1
+        return page
+
+    async def release(self, key, page):
+        context = page.context
+        reusable = False
+        try:
+            # The page still counts as rented while it is blanked, so a
+            # concurrent recycle can't close its context underneath it
+            if self.contexts.get(key) is context:
+                # Tab state (e.g. the Dreyfus/agency tab) lives in sessionStorage,
+                # which survives navigation within the same page
+                await page.evaluate('() => { try { sessionStorage.clear(); } catch (e) {} }')
+                await page.goto('about:blank')
+                reusable = True
+        finally:
+            async with self.lock:
+                self.rented[context] -= 1
+                # Re-check: the context may have been retired while blanking
+                if reusable and self.contexts.get(key) is context:
+                    self.queues[key].put_nowait(page)
+                else:
+                    await page.close()
+                    # Close a retired context once its last rented page is back
+                    if self.rented[context] == 0 and self.contexts.get(key) is not context:
+                        del self.rented[context]
+                        await context.close()
+
+    async def close(self):
+        for context in self.contexts.values():
+            await context.close()
 
 
 class Command(BaseCommand):
@@ -33,11 +248,44 @@ class Command(BaseCommand):
             default='http://localhost:8000',
             help='Base URL of the running application'
         )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Maximum number of screenshots captured in parallel (default: 4)'
+        )
+        parser.add_argument(
+            '--browsers',
+            type=int,
+            default=2,
+            help='Number of browser instances to shard captures across (default: 2)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=['png', 'jpeg'],
+            default='png',
+            help='Image format; jpeg encodes much faster, useful for quick previews (default: png)'
+        )
+        parser.add_argument(
+            '--quality',
+            type=int,
+            default=88,
+            help='JPEG quality (1-100, default: 88)'
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip screenshots whose file is newer than the configuration file'
+        )
 
     def handle(self, *args, **options):
         config_path = options['config']
         output_dir = options['output_dir']
         base_url = options['base_url']
+        concurrency = options['concurrency']
+        browser_count = options['browsers']
+        self.image_format = options['format']
+        self.jpeg_quality = options['quality']
 
         # Check if config exists
         if not os.path.exists(config_path):
@@ -60,506 +308,711 @@ class Command(BaseCommand):
         output_path.mkdir(parents=True, exist_ok=True)
         self.stdout.write(f'Output directory: {output_path}')
 
+        # Build the screenshot list up front so the async side only does I/O
+        screenshot_configs = self._build_screenshot_configs(config, base_url)
+
+        if options['incremental']:
+            # Screenshots taken after the data was generated are still current
+            config_mtime = os.path.getmtime(config_path)
+            suffix = '.jpg' if self.image_format == 'jpeg' else '.png'
+            fresh = {
+                screenshot_config['name']
+                for screenshot_config in screenshot_configs
+                if self._is_fresh(output_path / f'{screenshot_config["name"]}{suffix}', config_mtime)
+            }
+            screenshot_configs = [
+                screenshot_config for screenshot_config in screenshot_configs
+                if screenshot_config['name'] not in fresh
+            ]
+            self.stdout.write(f'Incremental: skipping {len(fresh)} up-to-date screenshots')
+
+            if not screenshot_configs:
+                self.stdout.write(self.style.SUCCESS('\nAll screenshots are up to date!'))
+                return
+
+        # A saved login is reused if it postdates the config (regenerating the
+        # data recreates the admin user) and is younger than the TTL
+        session_file = self._session_file(config, base_url)
+        reuse_session = self._is_fresh(
+            session_file,
+            max(os.path.getmtime(config_path), time.time() - SESSION_CACHE_TTL)
+        )
+
         # Run async screenshot capture
-        asyncio.run(self._capture_screenshots(config, base_url, output_path))
+        asyncio.run(self._capture_screenshots(
+            config, screenshot_configs, base_url, output_path, concurrency, browser_count,
+            session_file, reuse_session
+        ))
 
         self.stdout.write(self.style.SUCCESS('\nScreenshot capture complete!'))
 
-    async def _capture_screenshots(self, config, base_url, output_path):
-        """Async function to capture all screenshots"""
+    @staticmethod
+    def _is_fresh(path, since):
+        """Whether the file exists and was written after the `since` timestamp"""
         try:
-            from playwright.async_api import async_playwright
-        except ImportError:
-            self.stdout.write(self.style.ERROR(
-                'Playwright not installed. Run: pip install playwright && playwright install chromium'
-            ))
-            return
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-
-            # Login and get cookies
-            self.stdout.write('Logging in as admin...')
-            page = await browser.new_page()
-            await page.goto(f'{base_url}/accounts/login/')
-            await page.fill('input[name="login"]', config['admin_username'])
-            await page.fill('input[name="password"]', config['admin_password'])
-            await page.click('button[type="submit"]')
-            await page.wait_for_load_state('networkidle')
-
-            # Get cookies for reuse
-            cookies = await page.context.cookies()
-
-            # Define screenshot configurations
-            screenshot_configs = []
-
-            # Generate report screenshots for each questionnaire type
-            questionnaire_cycles = config.get('questionnaire_cycles', {})
-            report_tokens = config.get('report_tokens', {})
-
-            for q_key, cycle_data in questionnaire_cycles.items():
-                report_token = report_tokens.get(q_key)
-                if not report_token:
-                    self.stdout.write(self.style.WARNING(f'No report token for {q_key}, skipping'))
-                    continue
-
-                # Report overview - Desktop Light (top insights section)
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_overview_light',
-                    'url': f'{base_url}/my-report/{report_token}/',
+            return path.stat().st_mtime > since
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _session_file(config, base_url):
+        """Location of the saved login session for these credentials and server"""
+        key = hashlib.sha256(
+            f'{config["admin_username"]}:{config["admin_password"]}:{base_url}'.encode()
+        ).hexdigest()[:16]
+        return Path(tempfile.gettempdir()) / f'blik_screenshot_session_{key}.json'
+
+    @staticmethod
+    def _save_session(session_file, storage_state):
+        """
+        Write the login session so only the current user can read it.
+
+        The file holds the admin's session cookie and sits in the shared temp
+        directory, so it is created with 0600 permissions rather than the
+        umask default, and never written through a symlink.
+        """
+        fd = os.open(session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            # An existing file keeps its old mode despite O_CREAT
+            os.fchmod(fd, 0o600)
+            json.dump(storage_state, f)
+
+    def _build_screenshot_configs(self, config, base_url):
+        """Build the list of screenshots to capture from the loaded configuration"""
+        screenshot_configs = []
+
+        # Generate report screenshots for each questionnaire type
+        questionnaire_cycles = config.get('questionnaire_cycles', {})
+        report_tokens = config.get('report_tokens', {})
+
+        for q_key, cycle_data in questionnaire_cycles.items():
+            report_token = report_tokens.get(q_key)
+            if not report_token:
+                self.stdout.write(self.style.WARNING(f'No report token for {q_key}, skipping'))
+                continue
+
+            # Report overview - Desktop Light (top insights section)
+            screenshot_configs.append({
+                'name': f'report_{q_key}_overview_light',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'light',
+                'scroll_to_element': '#overall-performance',
+                'scroll_element_position': 'start',
+            })
+
+            # Report overview - Desktop Dark
+            screenshot_configs.append({
+                'name': f'report_{q_key}_overview_dark',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'dark',
+                'scroll_to_element': '#overall-performance',
+                'scroll_element_position': 'start',
+            })
+
+            # Report charts - Desktop Light (radar chart section)
+            screenshot_configs.append({
+                'name': f'report_{q_key}_charts_light',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'light',
+                'scroll_to_element': '#sectionRadarChart',
+                'scroll_element_position': 'center',
+            })
+
+            # Report charts - Desktop Dark
+            screenshot_configs.append({
+                'name': f'report_{q_key}_charts_dark',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'dark',
+                'scroll_to_element': '#sectionRadarChart',
+                'scroll_element_position': 'center',
+            })
+
+            # Report sections - Desktop Light (section-level performance with peer benchmarks)
+            screenshot_configs.append({
+                'name': f'report_{q_key}_sections_light',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'light',
+                'scroll_to_element': '#section-level-performance',
+                'scroll_element_position': 'start',
+            })
+
+            # Report sections - Desktop Dark
+            screenshot_configs.append({
+                'name': f'report_{q_key}_sections_dark',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'dark',
+                'scroll_to_element': '#section-level-performance',
+                'scroll_element_position': 'start',
+            })
+
+            # Report details - Desktop Light (detailed feedback with questions/answers)
+            screenshot_configs.append({
+                'name': f'report_{q_key}_details_light',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1200},
+                'theme': 'light',
+                'scroll_to_element': '#detailed-feedback',
+                'scroll_element_position': 'start',
+            })
+
+            # Report details - Desktop Dark
+            screenshot_configs.append({
+                'name': f'report_{q_key}_details_dark',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1200},
+                'theme': 'dark',
+                'scroll_to_element': '#detailed-feedback',
+                'scroll_element_position': 'start',
+            })
+
+            # Dreyfus Profile - Desktop Light (skill level visualization)
+            screenshot_configs.append({
+                'name': f'report_{q_key}_dreyfus_light',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1400},
+                'theme': 'light',
+                'scroll_to_element': '#skill-development-path',
+                'scroll_element_position': 'start',
+            })
+
+            # Dreyfus Profile - Desktop Dark
+            screenshot_configs.append({
+                'name': f'report_{q_key}_dreyfus_dark',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1400},
+                'theme': 'dark',
+                'scroll_to_element': '#skill-development-path',
+                'scroll_element_position': 'start',
+            })
+
+            # Agency Profile - Desktop Light (agency level visualization)
+            screenshot_configs.append({
+                'name': f'report_{q_key}_agency_light',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1400},
+                'theme': 'light',
+                'scroll_to_element': '#skill-development-path',
+                'scroll_element_position': 'start',
+                'click_element': 'button[data-tab="agency"]',
+            })
+
+            # Agency Profile - Desktop Dark
+            screenshot_configs.append({
+                'name': f'report_{q_key}_agency_dark',
+                'url': f'{base_url}/my-report/{report_token}/',
+                'viewport': {'width': 1920, 'height': 1400},
+                'theme': 'dark',
+                'scroll_to_element': '#skill-development-path',
+                'scroll_element_position': 'start',
+                'click_element': 'button[data-tab="agency"]',
+            })
+
+        # Additional legacy screenshots using first completed cycle (for backward compatibility)
+        if config.get('report_tokens'):
+            first_token = next(iter(config['report_tokens'].values()))
+
+            # Legacy report screenshots
+            screenshot_configs.extend([
+                # Report header - Desktop Light
+                {
+                    'name': 'report_header_desktop_light',
+                    'url': f'{base_url}/my-report/{first_token}/',
                     'viewport': {'width': 1920, 'height': 1080},
                     'theme': 'light',
-                    'scroll_to_element': '#overall-performance',
-                    'scroll_element_position': 'start',
-                })
-
-                # Report overview - Desktop Dark
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_overview_dark',
-                    'url': f'{base_url}/my-report/{report_token}/',
+                    'scroll_to': 0,
+                },
+                # Report header - Desktop Dark
+                {
+                    'name': 'report_header_desktop_dark',
+                    'url': f'{base_url}/my-report/{first_token}/',
                     'viewport': {'width': 1920, 'height': 1080},
                     'theme': 'dark',
-                    'scroll_to_element': '#overall-performance',
-                    'scroll_element_position': 'start',
-                })
-
-                # Report charts - Desktop Light (radar chart section)
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_charts_light',
-                    'url': f'{base_url}/my-report/{report_token}/',
+                    'scroll_to': 0,
+                },
+                # Report charts - Desktop Light
+                {
+                    'name': 'report_charts_desktop_light',
+                    'url': f'{base_url}/my-report/{first_token}/',
                     'viewport': {'width': 1920, 'height': 1080},
                     'theme': 'light',
                     'scroll_to_element': '#sectionRadarChart',
                     'scroll_element_position': 'center',
-                })
-
+                },
                 # Report charts - Desktop Dark
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_charts_dark',
-                    'url': f'{base_url}/my-report/{report_token}/',
+                {
+                    'name': 'report_charts_desktop_dark',
+                    'url': f'{base_url}/my-report/{first_token}/',
                     'viewport': {'width': 1920, 'height': 1080},
                     'theme': 'dark',
                     'scroll_to_element': '#sectionRadarChart',
                     'scroll_element_position': 'center',
-                })
-
-                # Report sections - Desktop Light (section-level performance with peer benchmarks)
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_sections_light',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1080},
-                    'theme': 'light',
-                    'scroll_to_element': '#section-level-performance',
-                    'scroll_element_position': 'start',
-                })
-
-                # Report sections - Desktop Dark
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_sections_dark',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1080},
-                    'theme': 'dark',
-                    'scroll_to_element': '#section-level-performance',
-                    'scroll_element_position': 'start',
-                })
-
-                # Report details - Desktop Light (detailed feedback with questions/answers)
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_details_light',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1200},
-                    'theme': 'light',
-                    'scroll_to_element': '#detailed-feedback',
-                    'scroll_element_position': 'start',
-                })
-
-                # Report details - Desktop Dark
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_details_dark',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1200},
-                    'theme': 'dark',
-                    'scroll_to_element': '#detailed-feedback',
-                    'scroll_element_position': 'start',
-                })
-
-                # Dreyfus Profile - Desktop Light (skill level visualization)
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_dreyfus_light',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1400},
-                    'theme': 'light',
-                    'scroll_to_element': '#skill-development-path',
-                    'scroll_element_position': 'start',
-                })
-
-                # Dreyfus Profile - Desktop Dark
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_dreyfus_dark',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1400},
-                    'theme': 'dark',
-                    'scroll_to_element': '#skill-development-path',
-                    'scroll_element_position': 'start',
-                })
-
-                # Agency Profile - Desktop Light (agency level visualization)
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_agency_light',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1400},
-                    'theme': 'light',
-                    'scroll_to_element': '#skill-development-path',
-                    'scroll_element_position': 'start',
-                    'click_element': 'button[data-tab="agency"]',
-                })
-
-                # Agency Profile - Desktop Dark
-                screenshot_configs.append({
-                    'name': f'report_{q_key}_agency_dark',
-                    'url': f'{base_url}/my-report/{report_token}/',
-                    'viewport': {'width': 1920, 'height': 1400},
-                    'theme': 'dark',
-                    'scroll_to_element': '#skill-development-path',
-                    'scroll_element_position': 'start',
-                    'click_element': 'button[data-tab="agency"]',
-                })
-
-            # Additional legacy screenshots using first completed cycle (for backward compatibility)
-            if config.get('report_tokens'):
-                first_token = list(config['report_tokens'].values())[0]
-
-                # Legacy report screenshots
-                screenshot_configs.extend([
-                    # Report header - Desktop Light
-                    {
-                        'name': 'report_header_desktop_light',
-                        'url': f'{base_url}/my-report/{first_token}/',
-                        'viewport': {'width': 1920, 'height': 1080},
-                        'theme': 'light',
-                        'scroll_to': 0,
-                    },
-                    # Report header - Desktop Dark
-                    {
-                        'name': 'report_header_desktop_dark',
-                        'url': f'{base_url}/my-report/{first_token}/',
-                        'viewport': {'width': 1920, 'height': 1080},
-                        'theme': 'dark',
-                        'scroll_to': 0,
-                    },
-                    # Report charts - Desktop Light
-                    {
-                        'name': 'report_charts_desktop_light',
-                        'url': f'{base_url}/my-report/{first_token}/',
-                        'viewport': {'width': 1920, 'height': 1080},
-                        'theme': 'light',
-                        'scroll_to_element': '#sectionRadarChart',
-                        'scroll_element_position': 'center',
-                    },
-                    # Report charts - Desktop Dark
-                    {
-                        'name': 'report_charts_desktop_dark',
-                        'url': f'{base_url}/my-report/{first_token}/',
-                        'viewport': {'width': 1920, 'height': 1080},
-                        'theme': 'dark',
-                        'scroll_to_element': '#sectionRadarChart',
-                        'scroll_element_position': 'center',
-                    },
-                    # Report - Tablet Light
-                    {
-                        'name': 'report_tablet_light',
-                        'url': f'{base_url}/my-report/{first_token}/',
-                        'viewport': {'width': 1024, 'height': 768},
-                        'theme': 'light',
-                        'scroll_to_element': '#sectionRadarChart',
-                        'scroll_element_position': 'start',
-                    },
-                    # Report - Tablet Dark
-                    {
-                        'name': 'report_tablet_dark',
-                        'url': f'{base_url}/my-report/{first_token}/',
-                        'viewport': {'width': 1024, 'height': 768},
-                        'theme': 'dark',
-                        'scroll_to_element': '#sectionRadarChart',
-                        'scroll_element_position': 'start',
-                    },
-                ])
-            # Dashboard and other admin screenshots
-            screenshot_configs.extend([
-                # Admin Dashboard - Desktop Light
-                {
-                    'name': 'dashboard_desktop_light',
-                    'url': f'{base_url}/dashboard/',
-                    'viewport': {'width': 1920, 'height': 1080},
-                    'theme': 'light',
-                    'wait_for': '.stats-grid',
                 },
-                # 8. Admin Dashboard - Desktop Dark
+                # Report - Tablet Light
                 {
-                    'name': 'dashboard_desktop_dark',
-                    'url': f'{base_url}/dashboard/',
-                    'viewport': {'width': 1920, 'height': 1080},
-                    'theme': 'dark',
-                    'wait_for': '.stats-grid',
-                },
-                # 9. Admin Dashboard - Mobile Light
-                {
-                    'name': 'dashboard_mobile_light',
-                    'url': f'{base_url}/dashboard/',
-                    'viewport': {'width': 375, 'height': 812},
+                    'name': 'report_tablet_light',
+                    'url': f'{base_url}/my-report/{first_token}/',
+                    'viewport': {'width': 1024, 'height': 768},
                     'theme': 'light',
-                    'wait_for': '.stats-grid',
+                    'scroll_to_element': '#sectionRadarChart',
+                    'scroll_element_position': 'start',
                 },
-                # 10. Admin Dashboard - Mobile Dark
+                # Report - Tablet Dark
                 {
-                    'name': 'dashboard_mobile_dark',
-                    'url': f'{base_url}/dashboard/',
-                    'viewport': {'width': 375, 'height': 812},
+                    'name': 'report_tablet_dark',
+                    'url': f'{base_url}/my-report/{first_token}/',
+                    'viewport': {'width': 1024, 'height': 768},
                     'theme': 'dark',
-                    'wait_for': '.stats-grid',
+                    'scroll_to_element': '#sectionRadarChart',
+                    'scroll_element_position': 'start',
                 },
-                # 11. Review Cycle Detail - Desktop Light
+            ])
+        # Dashboard and other admin screenshots
+        screenshot_configs.extend([
+            # Admin Dashboard - Desktop Light
+            {
+                'name': 'dashboard_desktop_light',
+                'url': f'{base_url}/dashboard/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'light',
+                'wait_for': '.stats-grid',
+            },
+            # 8. Admin Dashboard - Desktop Dark
+            {
+                'name': 'dashboard_desktop_dark',
+                'url': f'{base_url}/dashboard/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'dark',
+                'wait_for': '.stats-grid',
+            },
+            # 9. Admin Dashboard - Mobile Light
+            {
+                'name': 'dashboard_mobile_light',
+                'url': f'{base_url}/dashboard/',
+                'viewport': {'width': 375, 'height': 812},
+                'theme': 'light',
+                'wait_for': '.stats-grid',
+            },
+            # 10. Admin Dashboard - Mobile Dark
+            {
+                'name': 'dashboard_mobile_dark',
+                'url': f'{base_url}/dashboard/',
+                'viewport': {'width': 375, 'height': 812},
+                'theme': 'dark',
+                'wait_for': '.stats-grid',
+            },
+            # 11. Review Cycle Detail - Desktop Light
+            {
+                'name': 'cycle_detail_desktop_light',
+                'url': f'{base_url}/dashboard/cycles/{config["partial_cycle_uuid"]}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'light',
+                'wait_for': '.card',  # Wait for any card to appear (more reliable)
+            },
+            # 12. Review Cycle Detail - Desktop Dark
+            {
+                'name': 'cycle_detail_desktop_dark',
+                'url': f'{base_url}/dashboard/cycles/{config["partial_cycle_uuid"]}/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'dark',
+                'wait_for': '.card',  # Wait for any card to appear (more reliable)
+            },
+            # 13. Team Management - Desktop Light
+            {
+                'name': 'team_desktop_light',
+                'url': f'{base_url}/dashboard/team/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'light',
+                'wait_for': 'table',
+            },
+            # 14. Team Management - Desktop Dark
+            {
+                'name': 'team_desktop_dark',
+                'url': f'{base_url}/dashboard/team/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'dark',
+                'wait_for': 'table',
+            },
+            # Manage Invitations - Desktop Light
+            {
+                'name': 'invitations_desktop_light',
+                'url': f'{base_url}/dashboard/cycles/{config["partial_cycle_uuid"]}/invitations/',
+                'viewport': {'width': 1920, 'height': 1080},
+                'theme': 'light',
+                'wait_for': '#inviteForm',
+            },
+        ])
+
+        # Feedback form screenshots (public, no auth needed)
+        # Get token from config (generated during data creation)
+        feedback_token_str = config.get('feedback_token')
+
+        if feedback_token_str:
+            screenshot_configs.extend([
+                # 16. Feedback Form - Desktop Light
                 {
-                    'name': 'cycle_detail_desktop_light',
-                    'url': f'{base_url}/dashboard/cycles/{config["partial_cycle_uuid"]}/',
+                    'name': 'feedback_desktop_light',
+                    'url': f'{base_url}/feedback/{feedback_token_str}/',
                     'viewport': {'width': 1920, 'height': 1080},
                     'theme': 'light',
-                    'wait_for': '.card',  # Wait for any card to appear (more reliable)
+                    'wait_for': 'form',
+                    'public': True,
                 },
-                # 12. Review Cycle Detail - Desktop Dark
+                # 17. Feedback Form - Desktop Dark
                 {
-                    'name': 'cycle_detail_desktop_dark',
-                    'url': f'{base_url}/dashboard/cycles/{config["partial_cycle_uuid"]}/',
+                    'name': 'feedback_desktop_dark',
+                    'url': f'{base_url}/feedback/{feedback_token_str}/',
                     'viewport': {'width': 1920, 'height': 1080},
                     'theme': 'dark',
-                    'wait_for': '.card',  # Wait for any card to appear (more reliable)
+                    'wait_for': 'form',
+                    'public': True,
                 },
-                # 13. Team Management - Desktop Light
+                # 18. Feedback Form - Mobile Light
                 {
-                    'name': 'team_desktop_light',
-                    'url': f'{base_url}/dashboard/team/',
-                    'viewport': {'width': 1920, 'height': 1080},
+                    'name': 'feedback_mobile_light',
+                    'url': f'{base_url}/feedback/{feedback_token_str}/',
+                    'viewport': {'width': 375, 'height': 812},
                     'theme': 'light',
-                    'wait_for': 'table',
+                    'wait_for': 'form',
+                    'public': True,
                 },
-                # 14. Team Management - Desktop Dark
+                # 19. Feedback Form - Mobile Dark
                 {
-                    'name': 'team_desktop_dark',
-                    'url': f'{base_url}/dashboard/team/',
-                    'viewport': {'width': 1920, 'height': 1080},
+                    'name': 'feedback_mobile_dark',
+                    'url': f'{base_url}/feedback/{feedback_token_str}/',
+                    'viewport': {'width': 375, 'height': 812},
                     'theme': 'dark',
-                    'wait_for': 'table',
-                },
-                # Manage Invitations - Desktop Light
-                {
-                    'name': 'invitations_desktop_light',
-                    'url': f'{base_url}/dashboard/cycles/{config["partial_cycle_uuid"]}/invitations/',
-                    'viewport': {'width': 1920, 'height': 1080},
-                    'theme': 'light',
-                    'wait_for': '#inviteForm',
+                    'wait_for': 'form',
+                    'public': True,
                 },
             ])
 
-            # Capture screenshots
-            for i, screenshot_config in enumerate(screenshot_configs, 1):
-                self.stdout.write(f'\n[{i}/{len(screenshot_configs)}] Capturing: {screenshot_config["name"]}')
+        return screenshot_configs
 
-                # Create new page with viewport
-                page = await browser.new_page(
-                    viewport=screenshot_config['viewport'],
-                    device_scale_factor=1  # No scaling for crisp screenshots
-                )
+    async def _capture_screenshots(self, config, screenshot_configs, base_url, output_path,
+                                   concurrency, browser_count, session_file, reuse_session):
+        """Async function to capture all screenshots"""
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            self.stdout.write(self.style.ERROR(
+                'Playwright not installed. Run: pip install playwright && playwright install chromium'
+            ))
+            return
 
-                # Add cookies
-                await page.context.add_cookies(cookies)
+        async with async_playwright() as p:
+            browsers = await asyncio.gather(*(
+                p.chromium.launch(headless=True) for _ in range(max(1, browser_count))
+            ))
+            browser = browsers[0]
+
+            # Keep the authenticated state so recycled contexts stay logged in,
+            # saved to disk so reruns can skip the login
+            if reuse_session:
+                self.stdout.write(f'Reusing saved login session: {session_file}')
+                storage_state = str(session_file)
+            else:
+                self.stdout.write('Logging in as admin...')
+                page = await browser.new_page()
+                await page.goto(f'{base_url}/accounts/login/')
+                await page.fill('input[name="login"]', config['admin_username'])
+                await page.fill('input[name="password"]', config['admin_password'])
+                await page.click('button[type="submit"]')
+                await page.wait_for_load_state('networkidle')
+
+                storage_state = await page.context.storage_state()
+                self._save_session(session_file, storage_state)
+                await page.close()
 
-                # Set theme and dismiss welcome modal
-                await page.add_init_script(f'''
-                    localStorage.setItem('theme', '{screenshot_config['theme']}');
-                    localStorage.setItem('blik_welcome_seen', 'true');
-                ''')
+            # Routes run last-registered first: drop third-party requests before
+            # serving application assets from the shared cache
+            routes = [
+                (STATIC_ASSET_PATTERN, AssetCache().handle),
+                ('**/*', ThirdPartyBlocker(base_url).handle),
+            ]
+
+            # Chromium serializes screenshots within one browser, so shard the
+            # captures across several browsers and split the concurrency among them
+            page_groups = self._group_by_page(screenshot_configs)
+            browser_count = len(browsers)
+            per_browser = max(1, concurrency // browser_count)
+            self._completed = 0
+            self._total = len(screenshot_configs)
+
+            await asyncio.gather(*(
+                self._capture_shard(
+                    shard_browser, storage_state, routes,
+                    page_groups[i::browser_count], per_browser, output_path
+                )
+                for i, shard_browser in enumerate(browsers)
+            ))
 
-                # Navigate to page
-                await page.goto(screenshot_config['url'])
+            for shard_browser in browsers:
+                await shard_browser.close()
+
+    async def _capture_shard(self, browser, storage_state, routes, page_groups,
+                             concurrency, output_path):
+        """Capture a share of the screenshots using a single browser"""
+        # One browser context per (theme, auth) with the session and
+        # init script installed once; pages are pre-warmed per context, and no
+        # context ever needs more pages than there are capture slots or page
+        # loads using it
+        pool = PagePool(
+            lambda key: self._new_context(browser, storage_state, routes, key),
+            {
+                key: min(concurrency, count)
+                for key, count in Counter(
+                    self._context_key(group[0]) for group in page_groups
+                ).items()
+            }
+        )
+        await pool.warm()
+        try:
+            await self._capture_all(pool, page_groups, concurrency, output_path)
+        finally:
+            await pool.close()
+
+    @staticmethod
+    def _context_key(screenshot_config):
+        """Screenshots sharing theme and auth can share a browser context"""
+        return (screenshot_config['theme'], screenshot_config.get('public', False))
+
+    async def _new_context(self, browser, storage_state, routes, key):
+        """Create a browser context with session and theme init script pre-installed"""
+        theme, is_public = key
+        # Pages are resized to each screenshot's viewport before capture
+        context = await browser.new_context(
+            device_scale_factor=1,  # No scaling for crisp screenshots
+            # Public pages such as the feedback form need no auth
+            storage_state=None if is_public else storage_state
+        )
 
-                # Wait for specific element
-                if 'wait_for' in screenshot_config:
-                    try:
-                        await page.wait_for_selector(screenshot_config['wait_for'], timeout=15000)
-                    except Exception as e:
-                        self.stdout.write(self.style.WARNING(
-                            f'  Warning: Could not find selector {screenshot_config["wait_for"]}: {e}'
-                        ))
+        # Shared request handlers (asset cache, third-party blocking)
+        for pattern, handler in routes:
+            await context.route(pattern, handler)
+
+        # Set theme and dismiss welcome modal
+        await context.add_init_script(INIT_SCRIPTS[theme])
+
+        return context
+
+    @classmethod
+    def _group_by_page(cls, screenshot_configs):
+        """
+        Group screenshots that can be taken from a single page load.
+
+        Screenshots of the same URL in the same context only differ in
+        viewport, scroll position and clicked tabs, so they share one
+        navigation. Screenshots are ordered by viewport to minimise resizes,
+        and those that click something go last since clicks change the page
+        state.
+        """
+        groups = {}
+        for screenshot_config in screenshot_configs:
+            key = (cls._context_key(screenshot_config), screenshot_config['url'])
+            groups.setdefault(key, []).append(screenshot_config)
+        return [
+            sorted(group, key=lambda screenshot_config: (
+                'click_element' in screenshot_config,
+                screenshot_config['viewport']['width'],
+                screenshot_config['viewport']['height'],
+            ))
+            for group in groups.values()
+        ]
+
+    async def _capture_all(self, pool, page_groups, concurrency, output_path):
+        """
+        Capture screenshots as a two-stage pipeline.
+
+        `concurrency` producers load a page per group and position it for each
+        screenshot (clicks, scrolling) while a single consumer takes the
+        screenshots, so page loads overlap with PNG encoding instead of running
+        back to back.
+        """
+        prepared = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+        remaining = iter(page_groups)  # Shared by all producers
+
+        def fail(screenshot_config, error):
+            self.stdout.write(self.style.ERROR(
+                f'  Failed: {screenshot_config["name"]}: {error}'
+            ))
 
-                # Additional wait for charts/animations to fully render
-                await page.wait_for_timeout(3000)
+        async def release(key, page, screenshot_config):
+            # Never let a failed release kill a pipeline stage: a dead consumer
+            # or producer leaves the others blocked on the queue forever
+            try:
+                await pool.release(key, page)
+            except Exception as e:
+                fail(screenshot_config, f'could not release page: {e}')
+
+        async def produce():
+            for group in remaining:
+                key = self._context_key(group[0])
+                page = await pool.acquire(key)
+                try:
+                    await self._load_page(page, group[0])
+                except Exception as e:
+                    await release(key, page, group[0])
+                    for screenshot_config in group:
+                        fail(screenshot_config, e)
+                    continue
 
-                # For report pages with charts, wait for Chart.js to finish rendering
-                if 'report' in screenshot_config['name']:
+                for index, screenshot_config in enumerate(group):
+                    is_last = index == len(group) - 1
                     try:
-                        # Wait for canvas elements to be present and rendered
-                        await page.wait_for_function(
-                            """() => {
-                                const canvases = document.querySelectorAll('canvas');
-                                return canvases.length > 0 &&
-                                       Array.from(canvases).every(c => c.getContext('2d') !== null);
-                            }""",
-                            timeout=5000
-                        )
-                    except:
-                        pass  # Continue even if charts don't load
-
-                # Click element if needed (e.g., for tab switching)
-                if 'click_element' in screenshot_config:
-                    try:
-                        click_selector = screenshot_config['click_element']
-                        await page.wait_for_selector(click_selector, timeout=5000)
-                        await page.click(click_selector)
-                        await page.wait_for_timeout(1000)  # Wait for tab transition
-                    except Exception as e:
-                        self.stdout.write(self.style.WARNING(
-                            f'  Warning: Could not click element {screenshot_config["click_element"]}: {e}'
-                        ))
-
-                # Scroll if needed
-                if 'scroll_to' in screenshot_config:
-                    # Legacy pixel-based scrolling
-                    await page.evaluate(f'window.scrollTo(0, {screenshot_config["scroll_to"]})')
-                    await page.wait_for_timeout(500)
-                elif 'scroll_to_element' in screenshot_config:
-                    # Element-based scrolling
-                    try:
-                        element_selector = screenshot_config['scroll_to_element']
-                        position = screenshot_config.get('scroll_element_position', 'start')
-
-                        # Wait for element to exist
-                        await page.wait_for_selector(element_selector, timeout=5000)
-
-                        # Scroll element into view with specified position
-                        # 'start' = top of element aligned to top of viewport
-                        # 'center' = element centered in viewport
-                        # 'end' = bottom of element aligned to bottom of viewport
-                        await page.locator(element_selector).scroll_into_view_if_needed()
-
-                        if position == 'center':
-                            # Center the element in viewport
-                            await page.evaluate(f'''
-                                {{
-                                    const element = document.querySelector("{element_selector}");
-                                    const elementRect = element.getBoundingClientRect();
-                                    const absoluteElementTop = elementRect.top + window.pageYOffset;
-                                    const middle = absoluteElementTop - (window.innerHeight / 2) + (elementRect.height / 2);
-                                    window.scrollTo(0, middle);
-                                }}
-                            ''')
-                        elif position == 'end':
-                            # Align bottom of element with bottom of viewport
-                            await page.evaluate(f'''
-                                {{
-                                    const element = document.querySelector("{element_selector}");
-                                    const elementRect = element.getBoundingClientRect();
-                                    const absoluteElementTop = elementRect.top + window.pageYOffset;
-                                    const bottom = absoluteElementTop + elementRect.height - window.innerHeight;
-                                    window.scrollTo(0, bottom);
-                                }}
-                            ''')
-                        # 'start' is already handled by scroll_into_view_if_needed
-
-                        await page.wait_for_timeout(500)
+                        await self._position_page(page, screenshot_config)
                     except Exception as e:
-                        self.stdout.write(self.style.WARNING(
-                            f'  Warning: Could not scroll to element {screenshot_config["scroll_to_element"]}: {e}'
-                        ))
-
-                # Take screenshot
-                output_file = output_path / f'{screenshot_config["name"]}.png'
-                await page.screenshot(
-                    path=str(output_file),
-                    full_page=False,  # Viewport only
-                    type='png'
-                )
-
-                self.stdout.write(self.style.SUCCESS(f'  ✓ Saved: {output_file}'))
-
-                await page.close()
-
-            # Now capture feedback form screenshots (public, no auth needed)
-            # Get token from config (generated during data creation)
-            feedback_token_str = config.get('feedback_token')
-
-            if feedback_token_str:
-                feedback_configs = [
-                    # 16. Feedback Form - Desktop Light
-                    {
-                        'name': 'feedback_desktop_light',
-                        'url': f'{base_url}/feedback/{feedback_token_str}/',
-                        'viewport': {'width': 1920, 'height': 1080},
-                        'theme': 'light',
-                        'wait_for': 'form',
-                    },
-                    # 17. Feedback Form - Desktop Dark
-                    {
-                        'name': 'feedback_desktop_dark',
-                        'url': f'{base_url}/feedback/{feedback_token_str}/',
-                        'viewport': {'width': 1920, 'height': 1080},
-                        'theme': 'dark',
-                        'wait_for': 'form',
-                    },
-                    # 18. Feedback Form - Mobile Light
-                    {
-                        'name': 'feedback_mobile_light',
-                        'url': f'{base_url}/feedback/{feedback_token_str}/',
-                        'viewport': {'width': 375, 'height': 812},
-                        'theme': 'light',
-                        'wait_for': 'form',
-                    },
-                    # 19. Feedback Form - Mobile Dark
-                    {
-                        'name': 'feedback_mobile_dark',
-                        'url': f'{base_url}/feedback/{feedback_token_str}/',
-                        'viewport': {'width': 375, 'height': 812},
-                        'theme': 'dark',
-                        'wait_for': 'form',
-                    },
-                ]
-
-                feedback_start = len(screenshot_configs) + 1
-                total_screenshots = len(screenshot_configs) + len(feedback_configs)
-
-                for i, screenshot_config in enumerate(feedback_configs, feedback_start):
-                    self.stdout.write(f'\n[{i}/{total_screenshots}] Capturing: {screenshot_config["name"]}')
-
-                    page = await browser.new_page(
-                        viewport=screenshot_config['viewport'],
-                        device_scale_factor=1
+                        fail(screenshot_config, e)
+                        if is_last:
+                            await release(key, page, screenshot_config)
+                        continue
+
+                    # Wait for the capture before repositioning the same page
+                    captured = asyncio.Event()
+                    await prepared.put((screenshot_config, key, page, is_last, captured))
+                    await captured.wait()
+
+        async def consume():
+            while (item := await prepared.get()) is not None:
+                screenshot_config, key, page, is_last, captured = item
+                try:
+                    output_file, image = await self._take_screenshot(
+                        page, screenshot_config, output_path
                     )
+                except Exception as e:
+                    fail(screenshot_config, e)
+                    continue
+                finally:
+                    if is_last:
+                        await release(key, page, screenshot_config)
+                    captured.set()
+
+                # Write the file in a thread so the browser can start on the
+                # next screenshot straight away
+                writes.append(asyncio.create_task(
+                    self._write_screenshot(screenshot_config, output_file, image)
+                ))
+
+        consumer = asyncio.create_task(consume())
+        writes = []
+        try:
+            await asyncio.gather(*(produce() for _ in range(max(1, concurrency))))
+        finally:
+            await prepared.put(None)
+            await consumer
+            await asyncio.gather(*writes)
+
+    async def _write_screenshot(self, screenshot_config, output_file, image):
+        """Write a captured screenshot to disk off the event loop"""
+        try:
+            await asyncio.to_thread(output_file.write_bytes, image)
+        except OSError as e:
+            self.stdout.write(self.style.ERROR(
+                f'  Failed: {screenshot_config["name"]}: {e}'
+            ))
+            return
 
-                    await page.add_init_script(f'''
-                        localStorage.setItem('theme', '{screenshot_config['theme']}');
-                        localStorage.setItem('blik_welcome_seen', 'true');
-                    ''')
-
-                    await page.goto(screenshot_config['url'])
-
-                    if 'wait_for' in screenshot_config:
-                        try:
-                            await page.wait_for_selector(screenshot_config['wait_for'], timeout=10000)
-                        except Exception as e:
-                            self.stdout.write(self.style.WARNING(
-                                f'  Warning: Could not find selector {screenshot_config["wait_for"]}: {e}'
-                            ))
-
-                    await page.wait_for_timeout(1000)
-
-                    output_file = output_path / f'{screenshot_config["name"]}.png'
-                    await page.screenshot(
-                        path=str(output_file),
-                        full_page=False,
-                        type='png'
-                    )
-
-                    self.stdout.write(self.style.SUCCESS(f'  ✓ Saved: {output_file}'))
-
-                    await page.close()
-
-            await browser.close()
+        # Single event loop, so the counter increment needs no lock
+        self._completed += 1
+        self.stdout.write(self.style.SUCCESS(
+            f'[{self._completed}/{self._total}] ✓ Saved: {output_file}'
+        ))
+
+    async def _load_page(self, page, screenshot_config):
+        """Navigate and wait until the page has finished rendering"""
+        is_public = screenshot_config.get('public', False)
+
+        # Navigate to page
+        await page.set_viewport_size(screenshot_config['viewport'])
+        await page.goto(screenshot_config['url'])
+
+        # Wait for specific element
+        if 'wait_for' in screenshot_config:
+            try:
+                await page.wait_for_selector(
+                    screenshot_config['wait_for'],
+                    timeout=10000 if is_public else 15000
+                )
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(
+                    f'  Warning: Could not find selector {screenshot_config["wait_for"]}: {e}'
+                ))
+
+        # Wait for the network to settle and web fonts to load
+        await page.wait_for_load_state('networkidle')
+        await page.evaluate(FONTS_READY_JS)
+
+        # For report pages with charts, wait for Chart.js to finish rendering
+        if 'report' in screenshot_config['name']:
+            try:
+                await page.wait_for_function(CHARTS_SETTLED_JS, timeout=5000)
+            except Exception:
+                pass  # Continue even if charts don't load
+
+    async def _position_page(self, page, screenshot_config):
+        """Resize, click and scroll a loaded page into the state to be captured"""
+        # Resizing a loaded page is much cheaper than navigating again
+        if page.viewport_size != screenshot_config['viewport']:
+            await page.set_viewport_size(screenshot_config['viewport'])
+            await page.evaluate("() => window.dispatchEvent(new Event('resize'))")
+            if 'report' in screenshot_config['name']:
+                try:
+                    # Responsive charts redraw on resize
+                    await page.wait_for_function(CHARTS_SETTLED_JS, timeout=5000)
+                except Exception:
+                    pass  # Continue even if charts don't load
+            await page.evaluate(NEXT_PAINT_JS)
+
+        # Click element if needed (e.g., for tab switching)
+        if 'click_element' in screenshot_config:
+            try:
+                click_selector = screenshot_config['click_element']
+                await page.wait_for_selector(click_selector, timeout=5000)
+                await page.click(click_selector)
+                # Wait for the tab to become active and the switch to paint
+                await page.wait_for_selector(f'{click_selector}.active', timeout=5000)
+                await page.evaluate(NEXT_PAINT_JS)
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(
+                    f'  Warning: Could not click element {screenshot_config["click_element"]}: {e}'
+                ))
+
+        # Scroll if needed
+        if 'scroll_to' in screenshot_config:
+            # Legacy pixel-based scrolling
+            await page.evaluate(f'window.scrollTo(0, {screenshot_config["scroll_to"]})')
+            await page.evaluate(NEXT_PAINT_JS)
+        elif 'scroll_to_element' in screenshot_config:
+            # Element-based scrolling, read and write in a single round-trip
+            element_selector = screenshot_config['scroll_to_element']
+            position = screenshot_config.get('scroll_element_position', 'start')
+            found = await page.evaluate(
+                SCROLL_TO_ELEMENT_JS, [element_selector, position]
+            )
+            if not found:
+                self.stdout.write(self.style.WARNING(
+                    f'  Warning: Could not scroll to element {element_selector}'
+                ))
+
+    async def _take_screenshot(self, page, screenshot_config, output_path):
+        """Capture the prepared page's viewport into memory"""
+        if self.image_format == 'jpeg':
+            # Chromium's PNG encoder is slow at large viewports; JPEG is far cheaper
+            output_file = output_path / f'{screenshot_config["name"]}.jpg'
+            image = await page.screenshot(
+                full_page=False,  # Viewport only
+                type='jpeg',
+                quality=self.jpeg_quality
+            )
+        else:
+            output_file = output_path / f'{screenshot_config["name"]}.png'
+            image = await page.screenshot(
+                full_page=False,  # Viewport only
+                type='png'
+            )
+        return output_file, image
@@ -53,22 +53,28 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR('No organizations found'))
                 return
 
-        # Update settings
+        # Update settings, tracking which fields changed
+        changed = []
+
         if enable:
             org.allow_registration = True
+            changed.append('allow_registration')
             self.stdout.write(self.style.SUCCESS(f'Registration enabled for "{org.name}"'))
 
         if disable:
             org.allow_registration = False
+            changed.append('allow_registration')
             self.stdout.write(self.style.SUCCESS(f'Registration disabled for "{org.name}"'))
 
         if allow_cycle_creation:
             org.default_users_can_create_cycles = True
+            changed.append('default_users_can_create_cycles')
             self.stdout.write(
                 self.style.SUCCESS(f'New users will be able to create cycles for others by default')
             )
 
-        org.save()
+        if changed:
+            org.save(update_fields=changed + ['updated_at'])
 
         # Show current status
         self.stdout.write(self.style.WARNING('\nCurrent settings:'))
@@ -1,60 +1,119 @@
-from django.core.management.base import BaseCommand
-from django.db import connection
+from contextlib import contextmanager
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from psycopg import Pipeline, sql
 
 
 class Command(BaseCommand):
     help = 'Fix PostgreSQL sequences after loading fixtures'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--cache-size',
+            type=int,
+            help='Also set each sequence CACHE to this size (e.g. 1000 before bulk imports; '
+                 '1 restores the PostgreSQL default)',
+        )
+
     def handle(self, *args, **options):
         """
         Reset all PostgreSQL sequences to the correct values.
         This is needed after loading fixtures with hardcoded primary keys.
         """
-        tables_to_fix = [
-            'organizations',
-            'questionnaires',
-            'question_sections',
-            'questions',
-            'subscriptions_plan',
-            'subscriptions_subscription',
-            'accounts_userprofile',
-            'accounts_organizationinvitation',
-            'accounts_reviewee',
-            'reviews_reviewcycle',
-            'reviews_reviewertoken',
-            'reviews_response',
-            'reports_report',
-        ]
-
-        fixed_count = 0
+        cache_size = options.get('cache_size')
+        if cache_size is not None and cache_size < 1:
+            raise CommandError('--cache-size must be at least 1')
+
         with connection.cursor() as cursor:
-            for table in tables_to_fix:
-                try:
-                    # PostgreSQL sequence naming convention: {table}_id_seq
-                    sequence_name = f"{table}_id_seq"
-
-                    # Set sequence to MAX(id) + 1, or 1 if table is empty
-                    sql = f"""
-                        SELECT setval(
-                            '{sequence_name}',
-                            COALESCE((SELECT MAX(id) FROM {table}), 0) + 1,
-                            false
-                        );
-                    """
-                    cursor.execute(sql)
-                    result = cursor.fetchone()[0]
-
-                    self.stdout.write(
-                        self.style.SUCCESS(f'✓ Fixed {table} sequence -> next ID: {result}')
-                    )
-                    fixed_count += 1
-
-                except Exception as e:
-                    # Skip tables that don't exist or don't have sequences
-                    self.stdout.write(
-                        self.style.WARNING(f'⊘ Skipped {table}: {str(e)}')
-                    )
+            # Discover every sequence-backed column (serial or identity) in the
+            # current schema rather than guessing {table}_id_seq names. A table
+            # whose relation has no pages on disk is certainly empty; unlike the
+            # reltuples estimate this is exact even straight after loaddata.
+            cursor.execute(
+                """
+                SELECT table_name, column_name, pg_get_serial_sequence(
+                    quote_ident(table_schema) || '.' || quote_ident(table_name),
+                    column_name
+                ), pg_relation_size(
+                    (quote_ident(table_schema) || '.' || quote_ident(table_name))::regclass
+                ) = 0
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND (column_default LIKE 'nextval(%' OR is_identity = 'YES')
+                ORDER BY table_name, column_name
+                """
+            )
+            rows = [row for row in cursor.fetchall() if row[2]]
+            sequences = [(table, column, sequence_name) for table, column, sequence_name, _ in rows]
+            empty_tables = {table for table, _, _, is_empty in rows if is_empty}
+
+            # Set every sequence to MAX(column) + 1, or 1 if the table is empty,
+            # in a single statement. Table and column names are composed as
+            # quoted identifiers; sequence names are bound as parameters.
+            results = {}
+            if sequences:
+                query = sql.SQL(' UNION ALL ').join(
+                    sql.SQL("SELECT %s::text, setval(%s::regclass, 1, false)")
+                    if table in empty_tables else
+                    sql.SQL(
+                        "SELECT %s::text, setval(%s::regclass, "
+                        "COALESCE((SELECT MAX({column}) FROM {table}), 0) + 1, false)"
+                    ).format(column=sql.Identifier(column), table=sql.Identifier(table))
+                    for table, column, sequence_name in sequences
+                )
+                params = [
+                    name
+                    for table, column, sequence_name in sequences
+                    for name in (sequence_name, sequence_name)
+                ]
+
+                # Preallocating sequence values per session saves a WAL
+                # record on most inserts, at the cost of gaps in IDs
+                alter_statements = [
+                    f'ALTER SEQUENCE {sequence_name} CACHE {cache_size}'
+                    for table, column, sequence_name in sequences
+                ] if cache_size is not None else []
+
+                with transaction.atomic(), self._pipeline() as pipelined:
+                    cursor.execute(query, params)
+
+                    if alter_statements:
+                        # A cursor only keeps the result of its last execute,
+                        # so the ALTERs go through their own cursor
+                        with connection.cursor() as alter_cursor:
+                            if pipelined:
+                                # Pipeline mode takes one statement per execute,
+                                # but they are sent without waiting on each other
+                                for statement in alter_statements:
+                                    alter_cursor.execute(statement)
+                            else:
+                                alter_cursor.execute(';'.join(alter_statements))
+
+                    results = dict(cursor.fetchall())
+
+        for table, column, sequence_name in sequences:
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Fixed {table} sequence -> next ID: {results[sequence_name]}')
+            )
+
+        if cache_size is not None:
+            self.stdout.write(self.style.SUCCESS(f'✓ Set sequence cache size to {cache_size}'))
 
         self.stdout.write(
-            self.style.SUCCESS(f'\n✓ Successfully fixed {fixed_count} sequences!')
+            self.style.SUCCESS(f'\n✓ Successfully fixed {len(results)} sequences!')
         )
+
+    @contextmanager
+    def _pipeline(self):
+        """
+        Put the connection in psycopg pipeline mode, so statements are sent
+        without waiting for the previous result. Yields whether pipelining is
+        active; older libpq versions fall back to one round-trip per execute.
+        """
+        if not Pipeline.is_supported():
+            yield False
+            return
+
+        with connection.connection.pipeline():
+            yield True
@@ -2,16 +2,22 @@
 Management command to delete or anonymize a reviewee (GDPR compliance)
 
 Usage:
-    python manage.py gdpr_delete_reviewee <reviewee_id> [--hard] [--full-anonymization]
+    python manage.py gdpr_delete_reviewee <reviewee_id> [<reviewee_id> ...] [--hard] [--full-anonymization]
     python manage.py gdpr_delete_reviewee 123
+    python manage.py gdpr_delete_reviewee 123 124 125 --hard
     python manage.py gdpr_delete_reviewee 123 --hard
+    python manage.py gdpr_delete_reviewee 123 --hard --chunk-size 5000
+    python manage.py gdpr_delete_reviewee 123 --hard --purge-org
     python manage.py gdpr_delete_reviewee 123 --full-anonymization
+    python manage.py gdpr_delete_reviewee --ids-from-file ids.txt --yes
 """
 
+from contextlib import nullcontext
+
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from accounts.models import Reviewee
-from core.gdpr import GDPRDeletionService
-import json
+from core.gdpr import GDPRDeletionService, format_json
 
 
 class Command(BaseCommand):
@@ -19,9 +25,16 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument(
-            'reviewee_id',
+            'reviewee_ids',
             type=int,
-            help='ID of the reviewee to delete'
+            nargs='*',
+            metavar='reviewee_id',
+            help='ID(s) of the reviewee(s) to delete; all are processed in a single transaction'
+        )
+        parser.add_argument(
+            '--ids-from-file',
+            help='Path to a file with one reviewee ID per line (blank lines and # comments '
+                 'are ignored); all reviewees are processed in a single transaction'
         )
         parser.add_argument(
             '--hard',
@@ -33,33 +46,71 @@ class Command(BaseCommand):
             action='store_true',
             help='Anonymize reviewee AND all reviewer emails in their cycles'
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='With --hard, delete at most this many rows per transaction to keep locks short'
+        )
+        parser.add_argument(
+            '--purge-org',
+            action='store_true',
+            help='With --hard, TRUNCATE the review tables if this reviewee owns every review cycle '
+                 'in the database (e.g. wiping a single-organization install). PostgreSQL only; '
+                 'falls back to a normal hard delete otherwise'
+        )
         parser.add_argument(
             '--summary',
             action='store_true',
             help='Show data summary without deleting'
         )
+        parser.add_argument(
+            '--yes',
+            action='store_true',
+            help='Skip the confirmation prompt (for scripted use)'
+        )
 
     def handle(self, *args, **options):
-        reviewee_id = options['reviewee_id']
         hard_delete = options['hard']
         full_anonymization = options['full_anonymization']
         show_summary = options['summary']
+        chunk_size = options['chunk_size']
+        purge = options['purge_org']
 
         # Validate options
         if hard_delete and full_anonymization:
             raise CommandError('Cannot use both --hard and --full-anonymization')
-
-        # Check if reviewee exists
-        try:
-            reviewee = Reviewee.objects.get(pk=reviewee_id)
-        except Reviewee.DoesNotExist:
-            raise CommandError(f'Reviewee with ID {reviewee_id} does not exist')
+        if chunk_size is not None:
+            if not hard_delete:
+                raise CommandError('--chunk-size can only be used with --hard')
+            if chunk_size < 1:
+                raise CommandError('--chunk-size must be at least 1')
+        if purge:
+            if not hard_delete:
+                raise CommandError('--purge-org can only be used with --hard')
+            if chunk_size is not None:
+                raise CommandError('Cannot use both --purge-org and --chunk-size')
+
+        reviewee_ids = self._get_reviewee_ids(options)
+
+        # Check that every reviewee exists before touching any of them
+        reviewees = Reviewee.objects.select_related('organization').only(
+            'name', 'email', 'department', 'organization__name'
+        ).in_bulk(reviewee_ids)
+        missing = [str(reviewee_id) for reviewee_id in reviewee_ids if reviewee_id not in reviewees]
+        if missing:
+            raise CommandError(f'Reviewee with ID {", ".join(missing)} does not exist')
+
+        # Fetched once and shared by --summary and the confirmation banner
+        summaries = {
+            reviewee_id: GDPRDeletionService.get_reviewee_data_summary(reviewee_id)
+            for reviewee_id in reviewee_ids
+        }
 
         # Show summary if requested
         if show_summary:
-            self.stdout.write(self.style.SUCCESS(f'\nData summary for Reviewee {reviewee_id}:'))
-            summary = GDPRDeletionService.get_reviewee_data_summary(reviewee_id)
-            self.stdout.write(json.dumps(summary, indent=2))
+            for reviewee_id in reviewee_ids:
+                self.stdout.write(self.style.SUCCESS(f'\nData summary for Reviewee {reviewee_id}:'))
+                self.stdout.write(format_json(summaries[reviewee_id]))
             return
 
         # Determine deletion type
@@ -70,28 +121,29 @@ class Command(BaseCommand):
         else:
             deletion_type = 'SOFT DELETE (anonymization)'
 
-        self.stdout.write(
-            self.style.WARNING(
-                f'\n{deletion_type} for Reviewee {reviewee_id}:\n'
-                f'  Name: {reviewee.name}\n'
-                f'  Email: {reviewee.email}\n'
-                f'  Department: {reviewee.department}\n'
-                f'  Organization: {reviewee.organization.name}\n'
+        for reviewee_id in reviewee_ids:
+            reviewee = reviewees[reviewee_id]
+            summary = summaries[reviewee_id]
+            self.stdout.write(
+                self.style.WARNING(
+                    f'\n{deletion_type} for Reviewee {reviewee_id}:\n'
+                    f'  Name: {reviewee.name}\n'
+                    f'  Email: {reviewee.email}\n'
+                    f'  Department: {reviewee.department}\n'
+                    f'  Organization: {reviewee.organization.name}\n'
+                )
             )
-        )
 
-        # Get summary
-        summary = GDPRDeletionService.get_reviewee_data_summary(reviewee_id)
-        self.stdout.write(
-            self.style.WARNING(
-                f'  Total review cycles: {summary["review_cycles"]["total"]}\n'
-                f'  Active cycles: {summary["review_cycles"]["active"]}\n'
-                f'  Completed cycles: {summary["review_cycles"]["completed"]}\n'
-                f'  Reviewer tokens: {summary["tokens"]}\n'
-                f'  Responses: {summary["responses"]}\n'
-                f'  Reports: {summary["reports"]}\n'
+            self.stdout.write(
+                self.style.WARNING(
+                    f'  Total review cycles: {summary["review_cycles"]["total"]}\n'
+                    f'  Active cycles: {summary["review_cycles"]["active"]}\n'
+                    f'  Completed cycles: {summary["review_cycles"]["completed"]}\n'
+                    f'  Reviewer tokens: {summary["tokens"]}\n'
+                    f'  Responses: {summary["responses"]}\n'
+                    f'  Reports: {summary["reports"]}\n'
+                )
             )
-        )
 
         if hard_delete:
             self.stdout.write(
@@ -124,31 +176,64 @@ class Command(BaseCommand):
                 )
             )
 
-        confirm = input('\nType "yes" to confirm: ')
-        if confirm.lower() != 'yes':
-            self.stdout.write(self.style.ERROR('Deletion cancelled'))
-            return
+        if not options['yes']:
+            confirm = input('\nType "yes" to confirm: ')
+            if confirm.lower() != 'yes':
+                self.stdout.write(self.style.ERROR('Deletion cancelled'))
+                return
 
-        # Perform deletion
+        # Perform deletion. All reviewees share one transaction, so a failure
+        # leaves none of them processed; chunked hard deletes commit per chunk
+        # and so cannot be wrapped.
         try:
-            if full_anonymization:
-                result = GDPRDeletionService.delete_reviewee_and_anonymize_reviewer_emails(
-                    reviewee_id,
-                    performed_by=None  # CLI command
-                )
-            else:
-                result = GDPRDeletionService.delete_reviewee(
-                    reviewee_id,
-                    hard_delete=hard_delete,
-                    performed_by=None  # CLI command
-                )
-
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'\nSuccessfully processed Reviewee {reviewee_id}\n'
-                )
-            )
-            self.stdout.write(json.dumps(result, indent=2))
+            with nullcontext() if chunk_size else transaction.atomic():
+                for reviewee_id in reviewee_ids:
+                    if full_anonymization:
+                        result = GDPRDeletionService.delete_reviewee_and_anonymize_reviewer_emails(
+                            reviewee_id,
+                            performed_by=None  # CLI command
+                        )
+                    else:
+                        result = GDPRDeletionService.delete_reviewee(
+                            reviewee_id,
+                            hard_delete=hard_delete,
+                            performed_by=None,  # CLI command
+                            chunk_size=chunk_size,
+                            purge=purge
+                        )
+
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f'\nSuccessfully processed Reviewee {reviewee_id}\n'
+                        )
+                    )
+                    self.stdout.write(format_json(result))
 
         except Exception as e:
             raise CommandError(f'Error during deletion: {str(e)}')
+
+    def _get_reviewee_ids(self, options):
+        """Collect reviewee IDs from the positional arguments and --ids-from-file"""
+        reviewee_ids = list(options['reviewee_ids'])
+
+        if options['ids_from_file']:
+            try:
+                with open(options['ids_from_file']) as f:
+                    lines = f.read().splitlines()
+            except OSError as e:
+                raise CommandError(f'Cannot read {options["ids_from_file"]}: {e}')
+
+            for line in lines:
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                try:
+                    reviewee_ids.append(int(line))
+                except ValueError:
+                    raise CommandError(f'Invalid reviewee ID in {options["ids_from_file"]}: {line!r}')
+
+        if not reviewee_ids:
+            raise CommandError('Specify a reviewee ID or --ids-from-file')
+
+        # Preserve order, drop duplicates
+        return list(dict.fromkeys(reviewee_ids))
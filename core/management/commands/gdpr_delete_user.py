@@ -2,15 +2,17 @@
 Management command to delete or anonymize a user (GDPR compliance)
 
 Usage:
-    python manage.py gdpr_delete_user <user_id> [--hard]
+    python manage.py gdpr_delete_user <user_id> [<user_id> ...] [--hard]
     python manage.py gdpr_delete_user 123
+    python manage.py gdpr_delete_user 123 124 125 --hard
     python manage.py gdpr_delete_user 123 --hard
+    python manage.py gdpr_delete_user 123 --yes
 """
 
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
-from core.gdpr import GDPRDeletionService
-import json
+from django.db import transaction
+from core.gdpr import GDPRDeletionService, format_json
 
 
 class Command(BaseCommand):
@@ -18,9 +20,11 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument(
-            'user_id',
+            'user_ids',
             type=int,
-            help='ID of the user to delete'
+            nargs='+',
+            metavar='user_id',
+            help='ID(s) of the user(s) to delete; all are processed in a single transaction'
         )
         parser.add_argument(
             '--hard',
@@ -32,43 +36,51 @@ class Command(BaseCommand):
             action='store_true',
             help='Show data summary without deleting'
         )
+        parser.add_argument(
+            '--yes',
+            action='store_true',
+            help='Skip the confirmation prompt (for scripted use)'
+        )
 
     def handle(self, *args, **options):
-        user_id = options['user_id']
+        user_ids = list(dict.fromkeys(options['user_ids']))
         hard_delete = options['hard']
         show_summary = options['summary']
 
-        # Check if user exists
-        try:
-            user = User.objects.get(pk=user_id)
-        except User.DoesNotExist:
-            raise CommandError(f'User with ID {user_id} does not exist')
+        # Check that every user exists before touching any of them
+        users = User.objects.only('username', 'email', 'first_name', 'last_name').in_bulk(user_ids)
+        missing = [str(user_id) for user_id in user_ids if user_id not in users]
+        if missing:
+            raise CommandError(f'User with ID {", ".join(missing)} does not exist')
 
         # Show summary if requested
         if show_summary:
-            self.stdout.write(self.style.SUCCESS(f'\nData summary for User {user_id}:'))
-            summary = GDPRDeletionService.get_user_data_summary(user_id)
-            self.stdout.write(json.dumps(summary, indent=2))
+            for user_id in user_ids:
+                self.stdout.write(self.style.SUCCESS(f'\nData summary for User {user_id}:'))
+                summary = GDPRDeletionService.get_user_data_summary(user_id)
+                self.stdout.write(format_json(summary))
             return
 
         # Confirm deletion
         deletion_type = 'HARD DELETE (complete removal)' if hard_delete else 'SOFT DELETE (anonymization)'
-        self.stdout.write(
-            self.style.WARNING(
-                f'\n{deletion_type} for User {user_id}:\n'
-                f'  Username: {user.username}\n'
-                f'  Email: {user.email}\n'
-                f'  Name: {user.first_name} {user.last_name}\n'
+        for user_id in user_ids:
+            user = users[user_id]
+            self.stdout.write(
+                self.style.WARNING(
+                    f'\n{deletion_type} for User {user_id}:\n'
+                    f'  Username: {user.username}\n'
+                    f'  Email: {user.email}\n'
+                    f'  Name: {user.first_name} {user.last_name}\n'
+                )
             )
-        )
 
-        # Get summary
-        summary = GDPRDeletionService.get_user_data_summary(user_id)
-        self.stdout.write(
-            self.style.WARNING(
-                f'  Created review cycles: {summary["created_cycles"]}\n'
+            # Get summary
+            summary = GDPRDeletionService.get_user_data_summary(user_id)
+            self.stdout.write(
+                self.style.WARNING(
+                    f'  Created review cycles: {summary["created_cycles"]}\n'
+                )
             )
-        )
 
         if hard_delete:
             self.stdout.write(
@@ -87,25 +99,28 @@ class Command(BaseCommand):
                 )
             )
 
-        confirm = input('\nType "yes" to confirm: ')
-        if confirm.lower() != 'yes':
-            self.stdout.write(self.style.ERROR('Deletion cancelled'))
-            return
+        if not options['yes']:
+            confirm = input('\nType "yes" to confirm: ')
+            if confirm.lower() != 'yes':
+                self.stdout.write(self.style.ERROR('Deletion cancelled'))
+                return
 
-        # Perform deletion
+        # Perform deletion; a failure leaves none of the users processed
         try:
-            result = GDPRDeletionService.delete_user(
-                user_id,
-                hard_delete=hard_delete,
-                performed_by=None  # CLI command
-            )
+            with transaction.atomic():
+                for user_id in user_ids:
+                    result = GDPRDeletionService.delete_user(
+                        user_id,
+                        hard_delete=hard_delete,
+                        performed_by=None  # CLI command
+                    )
 
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'\nSuccessfully {result["deletion_type"]} deleted User {user_id}\n'
-                )
-            )
-            self.stdout.write(json.dumps(result, indent=2))
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f'\nSuccessfully {result["deletion_type"]} deleted User {user_id}\n'
+                        )
+                    )
+                    self.stdout.write(format_json(result))
 
         except Exception as e:
             raise CommandError(f'Error during deletion: {str(e)}')
@@ -10,9 +10,13 @@ Usage:
 
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
+from django.db.models import Count
 from accounts.models import Reviewee
-from core.gdpr import GDPRDeletionService
-import json
+from core.gdpr import GDPRDeletionService, format_json
+
+# Rows fetched per database round-trip and printed per write when listing
+LIST_CHUNK_SIZE = 2000
+LIST_WRITE_BATCH = 100
 
 
 class Command(BaseCommand):
@@ -62,7 +66,7 @@ class Command(BaseCommand):
         try:
             summary = GDPRDeletionService.get_user_data_summary(user_id)
             self.stdout.write(self.style.SUCCESS(f'\nUser {user_id} Data Summary:'))
-            self.stdout.write(json.dumps(summary, indent=2, default=str))
+            self.stdout.write(format_json(summary))
         except User.DoesNotExist:
             raise CommandError(f'User {user_id} does not exist')
         except Exception as e:
@@ -73,7 +77,7 @@ class Command(BaseCommand):
         try:
             summary = GDPRDeletionService.get_reviewee_data_summary(reviewee_id)
             self.stdout.write(self.style.SUCCESS(f'\nReviewee {reviewee_id} Data Summary:'))
-            self.stdout.write(json.dumps(summary, indent=2, default=str))
+            self.stdout.write(format_json(summary))
         except Reviewee.DoesNotExist:
             raise CommandError(f'Reviewee {reviewee_id} does not exist')
         except Exception as e:
@@ -81,39 +85,52 @@ class Command(BaseCommand):
 
     def _list_users(self, org_id=None):
         """List all users"""
-        users = User.objects.all()
+        users = User.objects.select_related('profile__organization')
 
         if org_id:
             users = users.filter(profile__organization_id=org_id)
 
         self.stdout.write(self.style.SUCCESS(f'\nTotal users: {users.count()}\n'))
 
-        for user in users:
-            try:
-                profile = user.profile
-                org_name = profile.organization.name
-            except:
-                org_name = 'No profile'
+        def rows():
+            for user in users.iterator(chunk_size=LIST_CHUNK_SIZE):
+                try:
+                    org_name = user.profile.organization.name
+                except User.profile.RelatedObjectDoesNotExist:
+                    org_name = 'No profile'
+
+                yield f'ID: {user.id:4d} | {user.username:20s} | {user.email:30s} | {org_name}'
 
-            self.stdout.write(
-                f'ID: {user.id:4d} | {user.username:20s} | {user.email:30s} | {org_name}'
-            )
+        self._write_rows(rows())
 
     def _list_reviewees(self, org_id=None):
         """List all reviewees"""
-        reviewees = Reviewee.objects.select_related('organization')
+        reviewees = Reviewee.objects.select_related('organization').annotate(
+            cycle_count=Count('review_cycles')
+        )
 
         if org_id:
             reviewees = reviewees.filter(organization_id=org_id)
 
         self.stdout.write(self.style.SUCCESS(f'\nTotal reviewees: {reviewees.count()}\n'))
 
-        for reviewee in reviewees:
-            from reviews.models import ReviewCycle
-            cycle_count = ReviewCycle.objects.filter(reviewee=reviewee).count()
-
-            active_str = 'Active' if reviewee.is_active else 'Inactive'
-            self.stdout.write(
-                f'ID: {reviewee.id:4d} | {reviewee.name:25s} | {reviewee.email:30s} | '
-                f'Cycles: {cycle_count:3d} | {active_str:8s} | {reviewee.organization.name}'
-            )
+        def rows():
+            for reviewee in reviewees.iterator(chunk_size=LIST_CHUNK_SIZE):
+                active_str = 'Active' if reviewee.is_active else 'Inactive'
+                yield (
+                    f'ID: {reviewee.id:4d} | {reviewee.name:25s} | {reviewee.email:30s} | '
+                    f'Cycles: {reviewee.cycle_count:3d} | {active_str:8s} | {reviewee.organization.name}'
+                )
+
+        self._write_rows(rows())
+
+    def _write_rows(self, rows):
+        """Write listing rows in batches rather than one write per line"""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= LIST_WRITE_BATCH:
+                self.stdout.write('\n'.join(batch))
+                batch = []
+        if batch:
+            self.stdout.write('\n'.join(batch))
@@ -1,21 +1,97 @@
 """
 Management command to generate realistic demo data for Blik.
 Creates diverse reviewees, cycles in various states, and realistic response patterns.
+
+Reviewees, reviewer tokens and responses are inserted with bulk_create (or, for
+responses on PostgreSQL, COPY), which skips save() and pre/post_save signals.
+None of these models override save() or have signal receivers, so the data is
+identical; use the factories for signal-sensitive tests. Review cycles are still
+created one by one, because ReviewCycle.save() fills in the invitation tokens
+and post_save drives webhooks.
 """
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 from accounts.models import Reviewee
 from questionnaires.models import Questionnaire, Question
 from reviews.models import ReviewCycle, ReviewerToken, Response
+from reports.models import Report
 from reports.services import generate_report
 from core.models import Organization
+import itertools
+import json
+import os
 import uuid
 import random
 from datetime import timedelta
 
 User = get_user_model()
 
+# Rows per INSERT statement when bulk-creating demo data
+BULK_CREATE_BATCH_SIZE = int(os.environ.get('DEMO_DATA_BULK_CREATE_BATCH_SIZE', '100'))
+
+# Rating (1-5) and scale-position (fraction of the scale) ranges per pattern
+RATING_RANGES = {
+    'high_performer': (4, 5),
+    'solid_performer': (3, 5),
+    'developing': (2, 4),
+}
+SCALE_RANGES = {
+    'high_performer': (0.75, 0.95),
+    'solid_performer': (0.6, 0.85),
+    'developing': (0.4, 0.65),
+}
+
+# Patterns where self-assessment differs from others: (self range, others range)
+ASYMMETRIC_RATING_RANGES = {
+    'imposter_syndrome': ((2, 3), (4, 5)),  # Self rates lower than others
+    'overconfident': ((4, 5), (2, 3)),      # Self rates higher than others
+}
+ASYMMETRIC_SCALE_RANGES = {
+    'imposter_syndrome': ((0.4, 0.6), (0.75, 0.9)),
+    'overconfident': ((0.8, 0.95), (0.4, 0.6)),
+}
+
+# Reviewer categories of a typical cycle, truncated to the cycle's token count
+BASE_CATEGORIES = ('self', 'peer', 'peer', 'peer', 'manager', 'direct_report', 'direct_report')
+
+# Comment pools for text answers
+POSITIVE_COMMENTS = [
+    'Consistently delivers high-quality work and exceeds expectations.',
+    'Great team player who actively helps others succeed.',
+    'Shows strong initiative and takes ownership of challenges.',
+    'Excellent communication skills across all levels of the organization.',
+    'Demonstrates deep expertise and shares knowledge generously.',
+    'Adapts quickly to change and handles ambiguity well.',
+    'Builds strong relationships and collaborates effectively.',
+    'Brings creative solutions to complex problems.',
+    'Mentors junior team members with patience and clarity.',
+    'Reliable and dependable - always follows through on commitments.',
+]
+
+CONSTRUCTIVE_COMMENTS = [
+    'Would benefit from improving time management on large projects.',
+    'Could be more proactive in seeking feedback and clarification.',
+    'Sometimes struggles with prioritization when juggling multiple tasks.',
+    'Would benefit from more active participation in team discussions.',
+    'Could improve on delegation and trusting team members more.',
+    'Sometimes gets too focused on details at the expense of the bigger picture.',
+    'Would benefit from being more receptive to alternative approaches.',
+    'Could work on communicating progress more regularly with stakeholders.',
+    'Would benefit from developing stronger cross-functional collaboration skills.',
+    'Could improve on meeting deadlines more consistently.',
+]
+
+
+def _pattern_range(pattern, category, ranges, asymmetric_ranges, default):
+    """Look up the answer range for a pattern, as seen by a reviewer category"""
+    if pattern in asymmetric_ranges:
+        self_range, others_range = asymmetric_ranges[pattern]
+        return self_range if category == 'self' else others_range
+    return ranges.get(pattern, default)
+
 
 class Command(BaseCommand):
     help = 'Generate realistic demo data for Blik showcase'
@@ -50,10 +126,7 @@ class Command(BaseCommand):
 
         if clear_existing:
             self.stdout.write('Clearing existing demo data...')
-            Response.objects.all().delete()
-            ReviewerToken.objects.all().delete()
-            ReviewCycle.objects.all().delete()
-            Reviewee.objects.all().delete()
+            self._clear_demo_data()
             self.stdout.write(self.style.SUCCESS('Cleared existing data'))
 
         # Get organization
@@ -74,7 +147,7 @@ class Command(BaseCommand):
         admin_profile = UserProfile.objects.filter(
             organization=organization,
             can_create_cycles_for_others=True
-        ).first()
+        ).select_related('user').first()
 
         if not admin_profile:
             self.stdout.write(self.style.ERROR(f'No admin user found for organization {organization.name}.'))
@@ -82,8 +155,17 @@ class Command(BaseCommand):
 
         admin_user = admin_profile.user
 
+        # Completed cycles whose reports are generated after the data commits
+        self._pending_reports = []
+        # Tokens and responses are inserted in one go after all cycles exist.
+        # Responses are queued as (cycle, question, token, answer_data) tuples.
+        self._pending_tokens = []
+        self._pending_responses = []
+
         if options.get('scenarios'):
-            self._create_all_scenarios(organization, admin_user)
+            with transaction.atomic():
+                self._create_all_scenarios(organization, admin_user)
+            self._generate_pending_reports()
             return
 
         # Get questionnaires
@@ -94,79 +176,114 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Found {len(questionnaires)} questionnaires')
 
-        # Generate reviewees
-        first_names = [
-            'Sarah', 'Michael', 'Emily', 'David', 'Lisa', 'James', 'Jessica',
-            'Daniel', 'Amanda', 'Christopher', 'Ashley', 'Matthew', 'Jennifer',
-            'Joshua', 'Melissa', 'Andrew', 'Michelle', 'Ryan', 'Kimberly', 'Brian',
-            'Nicole', 'Kevin', 'Elizabeth', 'Jason', 'Rebecca', 'Justin', 'Laura',
-            'Robert', 'Stephanie', 'Brandon'
-        ]
-        last_names = [
-            'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller',
-            'Davis', 'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez',
-            'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin',
-            'Lee', 'Thompson', 'White', 'Harris', 'Sanchez', 'Clark', 'Ramirez',
-            'Lewis', 'Robinson', 'Walker'
-        ]
-        departments = [
-            'Engineering', 'Product', 'Design', 'Sales', 'Marketing',
-            'Customer Success', 'Operations', 'Finance', 'HR', 'Legal'
-        ]
+        # Questions per questionnaire, loaded in one query for the whole run.
+        # Only the columns answer generation reads are fetched; question and
+        # section text can be long.
+        self._questions_cache = {questionnaire.id: [] for questionnaire in questionnaires}
+        for question in Question.objects.filter(
+            section__questionnaire__in=questionnaires
+        ).select_related('section').only(
+            'question_type', 'config', 'section__questionnaire'
+        ).order_by('section__order', 'order'):
+            self._questions_cache[question.section.questionnaire_id].append(question)
+
+        # All inserts commit together at the end instead of one commit per row
+        with transaction.atomic():
+            # Generate reviewees
+            first_names = [
+                'Sarah', 'Michael', 'Emily', 'David', 'Lisa', 'James', 'Jessica',
+                'Daniel', 'Amanda', 'Christopher', 'Ashley', 'Matthew', 'Jennifer',
+                'Joshua', 'Melissa', 'Andrew', 'Michelle', 'Ryan', 'Kimberly', 'Brian',
+                'Nicole', 'Kevin', 'Elizabeth', 'Jason', 'Rebecca', 'Justin', 'Laura',
+                'Robert', 'Stephanie', 'Brandon'
+            ]
+            last_names = [
+                'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller',
+                'Davis', 'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez',
+                'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin',
+                'Lee', 'Thompson', 'White', 'Harris', 'Sanchez', 'Clark', 'Ramirez',
+                'Lewis', 'Robinson', 'Walker'
+            ]
+            departments = [
+                'Engineering', 'Product', 'Design', 'Sales', 'Marketing',
+                'Customer Success', 'Operations', 'Finance', 'HR', 'Legal'
+            ]
 
-        reviewees = []
-        for i in range(num_reviewees):
-            first = random.choice(first_names)
-            last = random.choice(last_names)
-            email = f'{first.lower()}.{last.lower()}@example.com'
-
-            reviewee = Reviewee.objects.create(
-                name=f'{first} {last}',
-                email=email,
-                department=random.choice(departments),
-                organization=organization
+            # Draw distinct name pairs whose email is not taken in this
+            # organization yet, so (organization, email) stays unique and the
+            # bulk insert cannot fail
+            existing_emails = set(
+                Reviewee.objects.filter(organization=organization).values_list('email', flat=True)
             )
-            reviewees.append(reviewee)
-
-        self.stdout.write(self.style.SUCCESS(f'Created {len(reviewees)} reviewees'))
-
-        # Create review cycles with diverse states
-        cycle_count = 0
-        completed_count = 0
-        active_count = 0
-        partial_count = 0
-
-        for reviewee in reviewees:
-            # 70% chance of having at least one cycle
-            if random.random() > 0.3:
-                questionnaire = random.choice(questionnaires)
-
-                # Determine cycle state
-                rand = random.random()
-                if rand < 0.4:  # 40% completed cycles
-                    cycle = self._create_completed_cycle(
-                        reviewee, questionnaire, admin_user
-                    )
-                    completed_count += 1
-                elif rand < 0.7:  # 30% partially completed (active)
-                    cycle = self._create_partial_cycle(
-                        reviewee, questionnaire, admin_user
-                    )
-                    partial_count += 1
-                else:  # 30% just started (active)
-                    cycle = self._create_new_cycle(
-                        reviewee, questionnaire, admin_user
-                    )
-                    active_count += 1
-
-                cycle_count += 1
+            name_pairs = [
+                (first, last)
+                for first, last in itertools.product(first_names, last_names)
+                if f'{first.lower()}.{last.lower()}@example.com' not in existing_emails
+            ]
+            if num_reviewees > len(name_pairs):
+                self.stdout.write(self.style.ERROR(
+                    f'Only {len(name_pairs)} unused demo names left in {organization.name}; '
+                    f'use --clear or fewer --reviewees.'
+                ))
+                return
+            random.shuffle(name_pairs)
+
+            new_reviewees = []
+            for (first, last), department in zip(
+                name_pairs[:num_reviewees],
+                random.choices(departments, k=num_reviewees),
+            ):
+                new_reviewees.append(Reviewee(
+                    name=f'{first} {last}',
+                    email=f'{first.lower()}.{last.lower()}@example.com',
+                    department=department,
+                    organization=organization
+                ))
+            reviewees = Reviewee.objects.bulk_create(new_reviewees, batch_size=BULK_CREATE_BATCH_SIZE)
+
+            self.stdout.write(self.style.SUCCESS(f'Created {len(reviewees)} reviewees'))
+
+            # Create review cycles with diverse states
+            cycle_count = 0
+            completed_count = 0
+            active_count = 0
+            partial_count = 0
+
+            for reviewee in reviewees:
+                # 70% chance of having at least one cycle
+                if random.random() > 0.3:
+                    questionnaire = random.choice(questionnaires)
+
+                    # Determine cycle state
+                    rand = random.random()
+                    if rand < 0.4:  # 40% completed cycles
+                        cycle = self._create_completed_cycle(
+                            reviewee, questionnaire, admin_user
+                        )
+                        completed_count += 1
+                    elif rand < 0.7:  # 30% partially completed (active)
+                        cycle = self._create_partial_cycle(
+                            reviewee, questionnaire, admin_user
+                        )
+                        partial_count += 1
+                    else:  # 30% just started (active)
+                        cycle = self._create_new_cycle(
+                            reviewee, questionnaire, admin_user
+                        )
+                        active_count += 1
+
+                    cycle_count += 1
+
+            self._flush_pending_rows()
+
+            self.stdout.write(self.style.SUCCESS(
+                f'Created {cycle_count} review cycles:\n'
+                f'  - {completed_count} completed with reports\n'
+                f'  - {partial_count} partially completed\n'
+                f'  - {active_count} newly created'
+            ))
 
-        self.stdout.write(self.style.SUCCESS(
-            f'Created {cycle_count} review cycles:\n'
-            f'  - {completed_count} completed with reports\n'
-            f'  - {partial_count} partially completed\n'
-            f'  - {active_count} newly created'
-        ))
+        self._generate_pending_reports()
 
     # ------------------------------------------------------------------
     # --scenarios mode: deterministic per-questionnaire test coverage
@@ -202,17 +319,16 @@ class Command(BaseCommand):
 
     def _create_all_scenarios(self, organization, admin_user):
         """Create deterministic per-questionnaire scenarios covering all lifecycle states."""
-        questionnaires = list(
-            Questionnaire.objects.filter(
-                is_active=True,
-                organization=organization,
+        # Organization questionnaires and the defaults (no org) in one query;
+        # fall back to the defaults only if the organization has none
+        candidates = list(
+            Questionnaire.objects.filter(is_active=True).filter(
+                Q(organization=organization) | Q(organization__isnull=True)
             )
         )
-        if not questionnaires:
-            # Fall back to default questionnaires (no org)
-            questionnaires = list(
-                Questionnaire.objects.filter(is_active=True, organization__isnull=True)
-            )
+        questionnaires = [
+            q for q in candidates if q.organization_id == organization.id
+        ] or candidates
         if not questionnaires:
             self.stdout.write(self.style.ERROR(
                 'No questionnaires found. Load fixtures first.'
@@ -221,39 +337,59 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Found {len(questionnaires)} questionnaires for scenarios')
 
+        # Shared by every scenario, so their timestamps line up
+        now = timezone.now()
+
         total_cycles = 0
         total_tokens = 0
         stats = {'completed': 0, 'active': 0}
 
+        # One reviewee per questionnaire and scenario, inserted together
+        tags = {q.id: self.QUESTIONNAIRE_TAGS.get(q.name, q.name[:8]) for q in questionnaires}
+        reviewees = iter(Reviewee.objects.bulk_create([
+            Reviewee(
+                name=f'{first} {scenario_label} [{tags[q.id]}]',
+                email=f'{first.lower()}.{scenario_label.lower()}.{tags[q.id].lower()}@demo.example.com',
+                department='Engineering',
+                organization=organization,
+            )
+            for q in questionnaires
+            for first, scenario_label in self.SCENARIO_NAMES
+        ], batch_size=BULK_CREATE_BATCH_SIZE))
+
+        # Questions for every questionnaire, loaded in one query
+        questions_by_questionnaire = {q.id: [] for q in questionnaires}
+        for question in Question.objects.filter(
+            section__questionnaire__in=questionnaires,
+        ).select_related('section').only(
+            'question_type', 'config', 'section__questionnaire'
+        ).order_by('section__order', 'order'):
+            questions_by_questionnaire[question.section.questionnaire_id].append(question)
+
         for q in questionnaires:
-            tag = self.QUESTIONNAIRE_TAGS.get(q.name, q.name[:8])
-            self.stdout.write(f'\n  Questionnaire: {q.name} [{tag}]')
+            tag = tags[q.id]
+            # Progress is written once per questionnaire
+            lines = [f'\n  Questionnaire: {q.name} [{tag}]']
 
-            questions = list(Question.objects.filter(
-                section__questionnaire=q,
-            ).order_by('section__order', 'order'))
+            questions = questions_by_questionnaire[q.id]
 
             for idx, (first, scenario_label) in enumerate(self.SCENARIO_NAMES):
-                reviewee_name = f'{first} {scenario_label} [{tag}]'
-                email = f'{first.lower()}.{scenario_label.lower()}.{tag.lower()}@demo.example.com'
-
-                reviewee = Reviewee.objects.create(
-                    name=reviewee_name,
-                    email=email,
-                    department='Engineering',
-                    organization=organization,
-                )
+                reviewee = next(reviewees)
 
                 scenario_num = idx + 1
                 cycle, num_tokens = self._create_scenario_cycle(
-                    scenario_num, reviewee, q, questions, admin_user,
+                    scenario_num, reviewee, q, questions, admin_user, now,
                 )
                 total_cycles += 1
                 total_tokens += num_tokens
                 status_label = 'completed' if cycle.status == 'completed' else 'active'
                 stats[status_label] += 1
-                self.stdout.write(f'    Scenario {scenario_num} ({scenario_label}): '
-                                  f'{status_label}, {num_tokens} tokens')
+                lines.append(f'    Scenario {scenario_num} ({scenario_label}): '
+                             f'{status_label}, {num_tokens} tokens')
+
+            self.stdout.write('\n'.join(lines))
+
+        self._flush_pending_rows()
 
         self.stdout.write(self.style.SUCCESS(
             f'\nScenario generation complete:\n'
@@ -264,7 +400,7 @@ class Command(BaseCommand):
         ))
 
     def _create_scenario_cycle(self, scenario_num, reviewee, questionnaire,
-                               questions, admin_user):
+                               questions, admin_user, now):
         """Dispatch to the right scenario builder. Returns (cycle, token_count)."""
         builders = {
             1: self._scenario_fully_completed_email,
@@ -273,16 +409,21 @@ class Command(BaseCommand):
             4: self._scenario_just_started_invites,
             5: self._scenario_self_review_only,
         }
-        return builders[scenario_num](reviewee, questionnaire, questions, admin_user)
+        return builders[scenario_num](reviewee, questionnaire, questions, admin_user, now)
 
     # -- helper: create an email-invited token ---------------------------
 
     def _create_email_invite_token(self, cycle, category, email,
                                    invited_days_ago=7,
                                    claimed=False, completed=False,
-                                   reminded=False):
-        """Create a token that was delivered via email invitation."""
-        now = timezone.now()
+                                   reminded=False, now=None):
+        """
+        Create a token that was delivered via email invitation.
+
+        The token is queued for _flush_pending_rows() rather than saved here.
+        """
+        if now is None:
+            now = timezone.now()
         invitation_sent = now - timedelta(days=invited_days_ago)
         kwargs = {
             'cycle': cycle,
@@ -301,14 +442,21 @@ class Command(BaseCommand):
             kwargs['completed_at'] = kwargs['claimed_at'] + timedelta(
                 hours=random.randint(1, 24)
             )
-        return ReviewerToken.objects.create(**kwargs)
+        token = ReviewerToken(**kwargs)
+        self._pending_tokens.append(token)
+        return token
 
     # -- helper: create an anonymous-link token --------------------------
 
     def _create_anonymous_token(self, cycle, category,
-                                claimed=False, completed=False):
-        """Create a token simulating anonymous link usage (no reviewer_email)."""
-        now = timezone.now()
+                                claimed=False, completed=False, now=None):
+        """
+        Create a token simulating anonymous link usage (no reviewer_email).
+
+        The token is queued for _flush_pending_rows() rather than saved here.
+        """
+        if now is None:
+            now = timezone.now()
         kwargs = {
             'cycle': cycle,
             'category': category,
@@ -323,28 +471,25 @@ class Command(BaseCommand):
             kwargs['completed_at'] = kwargs['claimed_at'] + timedelta(
                 hours=random.randint(1, 24)
             )
-        return ReviewerToken.objects.create(**kwargs)
+        token = ReviewerToken(**kwargs)
+        self._pending_tokens.append(token)
+        return token
 
     # -- helper: fill responses for a token ------------------------------
 
     def _fill_responses(self, cycle, token, questions, pattern='solid_performer'):
-        """Create Response objects for every question in the questionnaire."""
-        for question in questions:
-            answer_data = self._generate_answer(question, token.category, pattern)
-            Response.objects.create(
-                cycle=cycle,
-                question=question,
-                token=token,
-                category=token.category,
-                answer_data=answer_data,
-            )
+        """Queue a response for every question in the questionnaire."""
+        self._pending_responses.extend(
+            (cycle, question, token, self._generate_answer(question, token.category, pattern))
+            for question in questions
+        )
 
     # ====================================================================
     # Scenario 1 – Fully completed (email invites)
     # ====================================================================
 
     def _scenario_fully_completed_email(self, reviewee, questionnaire,
-                                        questions, admin_user):
+                                        questions, admin_user, now):
         cycle = ReviewCycle.objects.create(
             reviewee=reviewee,
             questionnaire=questionnaire,
@@ -365,15 +510,11 @@ class Command(BaseCommand):
                 cycle, cat, email,
                 invited_days_ago=14,
                 claimed=True, completed=True,
+                now=now,
             )
             self._fill_responses(cycle, token, questions, pattern)
 
-        try:
-            generate_report(cycle)
-        except Exception as e:
-            self.stdout.write(self.style.WARNING(
-                f'    Could not generate report for {reviewee.name}: {e}'
-            ))
+        self._pending_reports.append(cycle)
 
         return cycle, len(categories)
 
@@ -382,7 +523,7 @@ class Command(BaseCommand):
     # ====================================================================
 
     def _scenario_partially_completed_email(self, reviewee, questionnaire,
-                                            questions, admin_user):
+                                            questions, admin_user, now):
         cycle = ReviewCycle.objects.create(
             reviewee=reviewee,
             questionnaire=questionnaire,
@@ -396,6 +537,7 @@ class Command(BaseCommand):
         t = self._create_email_invite_token(
             cycle, 'self', self.REVIEWER_EMAILS[0],
             invited_days_ago=10, claimed=True, completed=True,
+            now=now,
         )
         self._fill_responses(cycle, t, questions, 'solid_performer')
         token_count += 1
@@ -404,6 +546,7 @@ class Command(BaseCommand):
         t = self._create_email_invite_token(
             cycle, 'peer', self.REVIEWER_EMAILS[1],
             invited_days_ago=10, claimed=True, completed=True,
+            now=now,
         )
         self._fill_responses(cycle, t, questions, 'high_performer')
         token_count += 1
@@ -412,6 +555,7 @@ class Command(BaseCommand):
         self._create_email_invite_token(
             cycle, 'peer', self.REVIEWER_EMAILS[2],
             invited_days_ago=10, claimed=True, completed=False,
+            now=now,
         )
         token_count += 1
 
@@ -419,6 +563,7 @@ class Command(BaseCommand):
         self._create_email_invite_token(
             cycle, 'manager', self.REVIEWER_EMAILS[3],
             invited_days_ago=10, claimed=False, reminded=True,
+            now=now,
         )
         token_count += 1
 
@@ -426,6 +571,7 @@ class Command(BaseCommand):
         self._create_email_invite_token(
             cycle, 'direct_report', self.REVIEWER_EMAILS[4],
             invited_days_ago=7, claimed=False,
+            now=now,
         )
         token_count += 1
 
@@ -433,6 +579,7 @@ class Command(BaseCommand):
         t = self._create_email_invite_token(
             cycle, 'peer', self.REVIEWER_EMAILS[5],
             invited_days_ago=8, claimed=True, completed=True,
+            now=now,
         )
         self._fill_responses(cycle, t, questions, 'developing')
         token_count += 1
@@ -444,7 +591,7 @@ class Command(BaseCommand):
     # ====================================================================
 
     def _scenario_anonymous_mixed(self, reviewee, questionnaire,
-                                  questions, admin_user):
+                                  questions, admin_user, now):
         cycle = ReviewCycle.objects.create(
             reviewee=reviewee,
             questionnaire=questionnaire,
@@ -457,6 +604,7 @@ class Command(BaseCommand):
         # Self – anonymous, claimed + completed
         t = self._create_anonymous_token(
             cycle, 'self', claimed=True, completed=True,
+            now=now,
         )
         self._fill_responses(cycle, t, questions, 'solid_performer')
         token_count += 1
@@ -464,6 +612,7 @@ class Command(BaseCommand):
         # Peer 1 – anonymous, claimed + completed
         t = self._create_anonymous_token(
             cycle, 'peer', claimed=True, completed=True,
+            now=now,
         )
         self._fill_responses(cycle, t, questions, 'high_performer')
         token_count += 1
@@ -471,12 +620,14 @@ class Command(BaseCommand):
         # Peer 2 – anonymous, claimed but not completed
         self._create_anonymous_token(
             cycle, 'peer', claimed=True, completed=False,
+            now=now,
         )
         token_count += 1
 
         # Manager – anonymous, claimed + completed
         t = self._create_anonymous_token(
             cycle, 'manager', claimed=True, completed=True,
+            now=now,
         )
         self._fill_responses(cycle, t, questions, 'solid_performer')
         token_count += 1
@@ -484,12 +635,14 @@ class Command(BaseCommand):
         # Direct report – anonymous, unclaimed (link shared but not clicked)
         self._create_anonymous_token(
             cycle, 'direct_report', claimed=False,
+            now=now,
         )
         token_count += 1
 
         # Peer 3 – anonymous, unclaimed
         self._create_anonymous_token(
             cycle, 'peer', claimed=False,
+            now=now,
         )
         token_count += 1
 
@@ -500,7 +653,7 @@ class Command(BaseCommand):
     # ====================================================================
 
     def _scenario_just_started_invites(self, reviewee, questionnaire,
-                                       questions, admin_user):
+                                       questions, admin_user, now):
         cycle = ReviewCycle.objects.create(
             reviewee=reviewee,
             questionnaire=questionnaire,
@@ -516,6 +669,7 @@ class Command(BaseCommand):
             self._create_email_invite_token(
                 cycle, cat, email,
                 invited_days_ago=2, claimed=False,
+                now=now,
             )
             token_count += 1
 
@@ -526,7 +680,7 @@ class Command(BaseCommand):
     # ====================================================================
 
     def _scenario_self_review_only(self, reviewee, questionnaire,
-                                   questions, admin_user):
+                                   questions, admin_user, now):
         cycle = ReviewCycle.objects.create(
             reviewee=reviewee,
             questionnaire=questionnaire,
@@ -540,6 +694,7 @@ class Command(BaseCommand):
         t = self._create_email_invite_token(
             cycle, 'self', self.REVIEWER_EMAILS[0],
             invited_days_ago=5, claimed=True, completed=True,
+            now=now,
         )
         self._fill_responses(cycle, t, questions, 'developing')
         token_count += 1
@@ -551,6 +706,7 @@ class Command(BaseCommand):
             self._create_email_invite_token(
                 cycle, cat, email,
                 invited_days_ago=5, claimed=False,
+                now=now,
             )
             token_count += 1
 
@@ -568,34 +724,31 @@ class Command(BaseCommand):
             created_by=admin_user,
             status='completed'
         )
+        now = timezone.now()
 
         # Create 5-9 tokens (varied team sizes)
         num_tokens = random.randint(5, 9)
-        categories = ['self'] + ['peer'] * 3 + ['manager'] + ['direct_report'] * 2
+        categories = list(BASE_CATEGORIES[:num_tokens])
 
         # Randomly add more peers or direct reports
-        while len(categories) < num_tokens:
-            categories.append(random.choice(['peer', 'direct_report']))
+        categories.extend(random.choices(('peer', 'direct_report'), k=num_tokens - len(categories)))
 
-        categories = categories[:num_tokens]
         random.shuffle(categories)
 
         tokens = []
         for category in categories:
-            completed_time = timezone.now() - timedelta(days=random.randint(1, 14))
-            token = ReviewerToken.objects.create(
+            completed_time = now - timedelta(days=random.randint(1, 14))
+            tokens.append(ReviewerToken(
                 cycle=cycle,
                 category=category,
                 token=uuid.uuid4(),
                 claimed_at=completed_time - timedelta(hours=random.randint(1, 48)),
                 completed_at=completed_time
-            )
-            tokens.append(token)
+            ))
+        self._pending_tokens.extend(tokens)
 
         # Create responses with realistic patterns
-        questions = list(Question.objects.filter(
-            section__questionnaire=questionnaire
-        ).order_by('section__order', 'order'))
+        questions = self._questions_cache[questionnaire.id]
 
         # Choose a performance pattern
         pattern = random.choice([
@@ -607,26 +760,15 @@ class Command(BaseCommand):
             'overconfident'
         ])
 
-        for token in tokens:
-            for question in questions:
-                answer_data = self._generate_answer(
-                    question, token.category, pattern
-                )
-                Response.objects.create(
-                    cycle=cycle,
-                    question=question,
-                    token=token,
-                    category=token.category,
-                    answer_data=answer_data
-                )
+        responses = [
+            (cycle, question, token, self._generate_answer(question, token.category, pattern))
+            for token in tokens
+            for question in questions
+        ]
+        self._pending_responses.extend(responses)
 
-        # Generate report
-        try:
-            generate_report(cycle)
-        except Exception as e:
-            self.stdout.write(self.style.WARNING(
-                f'Could not generate report for {reviewee.name}: {e}'
-            ))
+        # Report is generated once the data is committed
+        self._pending_reports.append(cycle)
 
         return cycle
 
@@ -638,58 +780,56 @@ class Command(BaseCommand):
             created_by=admin_user,
             status='active'
         )
+        now = timezone.now()
 
         num_tokens = random.randint(5, 8)
-        categories = ['self'] + ['peer'] * 3 + ['manager'] + ['direct_report'] * 2
-        categories = categories[:num_tokens]
+        categories = list(BASE_CATEGORIES[:num_tokens])
         random.shuffle(categories)
 
         # 40-70% of tokens completed
         num_completed = random.randint(int(num_tokens * 0.4), int(num_tokens * 0.7))
 
+        tokens = []
         for i, category in enumerate(categories):
-            claimed_time = timezone.now() - timedelta(days=random.randint(3, 21))
+            claimed_time = now - timedelta(days=random.randint(3, 21))
 
             if i < num_completed:
                 # Completed token
-                token = ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4(),
                     claimed_at=claimed_time,
                     completed_at=claimed_time + timedelta(hours=random.randint(1, 72))
-                )
-
-                # Add responses
-                questions = list(Question.objects.filter(
-                    section__questionnaire=questionnaire
-                ).order_by('section__order', 'order'))
-
-                pattern = random.choice(['high_performer', 'solid_performer', 'developing'])
-                for question in questions:
-                    answer_data = self._generate_answer(question, category, pattern)
-                    Response.objects.create(
-                        cycle=cycle,
-                        question=question,
-                        token=token,
-                        category=category,
-                        answer_data=answer_data
-                    )
+                ))
             elif random.random() < 0.5:
                 # Claimed but not completed
-                ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4(),
                     claimed_at=claimed_time
-                )
+                ))
             else:
                 # Not yet claimed
-                ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4()
+                ))
+        self._pending_tokens.extend(tokens)
+
+        # Add responses for the completed tokens
+        questions = self._questions_cache[questionnaire.id]
+
+        responses = []
+        for token in tokens[:num_completed]:
+            pattern = random.choice(['high_performer', 'solid_performer', 'developing'])
+            for question in questions:
+                responses.append(
+                    (cycle, question, token, self._generate_answer(question, token.category, pattern))
                 )
+        self._pending_responses.extend(responses)
 
         return cycle
 
@@ -701,49 +841,137 @@ class Command(BaseCommand):
             created_by=admin_user,
             status='active'
         )
+        now = timezone.now()
 
         num_tokens = random.randint(5, 8)
-        categories = ['self'] + ['peer'] * 3 + ['manager'] + ['direct_report'] * 2
-        categories = categories[:num_tokens]
+        categories = list(BASE_CATEGORIES[:num_tokens])
         random.shuffle(categories)
 
+        tokens = []
         for category in categories:
             # Maybe 0-2 tokens claimed
             if random.random() < 0.3:
-                claimed_time = timezone.now() - timedelta(days=random.randint(0, 5))
-                ReviewerToken.objects.create(
+                claimed_time = now - timedelta(days=random.randint(0, 5))
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4(),
                     claimed_at=claimed_time
-                )
+                ))
             else:
-                ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4()
-                )
+                ))
+        self._pending_tokens.extend(tokens)
 
         return cycle
 
+    def _generate_pending_reports(self):
+        """
+        Generate reports for the completed cycles collected during generation.
+
+        Runs after the generation transaction has committed, so the CPU-heavy
+        aggregation does not hold it open and a failed report cannot roll back
+        the demo data.
+        """
+        for cycle in self._pending_reports:
+            try:
+                generate_report(cycle)
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(
+                    f'Could not generate report for {cycle.reviewee.name}: {e}'
+                ))
+        self._pending_reports = []
+
+    def _clear_demo_data(self):
+        """Delete all reviewees and their review data (reports included)"""
+        models = [Report, Response, ReviewerToken, ReviewCycle, Reviewee]
+
+        if connection.vendor == 'postgresql':
+            # TRUNCATE skips the ORM's per-row cascade collection entirely. The
+            # tables are listed explicitly rather than using CASCADE, so this
+            # fails instead of wiping any table that starts referencing them.
+            tables = ', '.join(connection.ops.quote_name(model._meta.db_table) for model in models)
+            with connection.cursor() as cursor:
+                cursor.execute(f'TRUNCATE {tables} RESTART IDENTITY')
+            return
+
+        with transaction.atomic():
+            for model in models:
+                model.objects.all().delete()
+
+    def _flush_pending_rows(self):
+        """
+        Insert the tokens and responses collected across all cycles.
+
+        Doing this once per run instead of once per cycle keeps the number of
+        round-trips constant however many reviewees are generated.
+        """
+        ReviewerToken.objects.bulk_create(self._pending_tokens, batch_size=BULK_CREATE_BATCH_SIZE)
+        if not connection.features.can_return_rows_from_bulk_insert:
+            # Backends that cannot return inserted rows leave pk unset; look the
+            # tokens up by their (unique) token UUID so responses can point at them
+            by_token = ReviewerToken.objects.in_bulk(
+                [t.token for t in self._pending_tokens], field_name='token'
+            )
+            for token in self._pending_tokens:
+                token.pk = by_token[token.token].pk
+
+        # Responses were queued against the unsaved tokens, whose primary keys
+        # are set now
+        if connection.vendor == 'postgresql':
+            self._copy_responses(self._pending_responses)
+        else:
+            self._bulk_create_responses(self._pending_responses)
+
+        self._pending_tokens = []
+        self._pending_responses = []
+
+    def _bulk_create_responses(self, responses):
+        """Insert queued (cycle, question, token, answer_data) responses with bulk_create"""
+        Response.objects.bulk_create([
+            Response(
+                cycle=cycle,
+                question=question,
+                token=token,
+                category=token.category,
+                answer_data=answer_data,
+            )
+            for cycle, question, token, answer_data in responses
+        ], batch_size=BULK_CREATE_BATCH_SIZE)
+
+    def _copy_responses(self, responses):
+        """
+        Stream responses into PostgreSQL with COPY FROM STDIN, which avoids
+        the per-statement overhead of INSERT for the largest demo table.
+
+        Rows are written straight from the queued tuples, without building a
+        Response instance for each one.
+        """
+        fields = ['created_at', 'updated_at', 'cycle', 'question', 'token', 'category', 'answer_data']
+        table = connection.ops.quote_name(Response._meta.db_table)
+        columns = ', '.join(
+            connection.ops.quote_name(Response._meta.get_field(name).column) for name in fields
+        )
+        now = timezone.now()
+
+        with (
+            connection.cursor() as cursor,
+            cursor.cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy,
+        ):
+            for cycle, question, token, answer_data in responses:
+                copy.write_row((
+                    now, now, cycle.pk, question.pk, token.pk, token.category,
+                    json.dumps(answer_data),
+                ))
+
     def _generate_answer(self, question, category, pattern):
         """Generate realistic answer based on question type and pattern"""
         if question.question_type in ['rating', 'likert']:
             # Generate rating based on pattern and category
-            if pattern == 'high_performer':
-                base_range = (4, 5)
-            elif pattern == 'solid_performer':
-                base_range = (3, 5)
-            elif pattern == 'developing':
-                base_range = (2, 4)
-            elif pattern == 'imposter_syndrome':
-                # Self rates lower than others
-                base_range = (2, 3) if category == 'self' else (4, 5)
-            elif pattern == 'overconfident':
-                # Self rates higher than others
-                base_range = (4, 5) if category == 'self' else (2, 3)
-            else:
-                base_range = (3, 4)
+            base_range = _pattern_range(pattern, category, RATING_RANGES, ASYMMETRIC_RATING_RANGES, (3, 4))
 
             rating = random.randint(*base_range)
 
@@ -759,42 +987,16 @@ class Command(BaseCommand):
                 # 30% chance of no comment
                 return {'value': ''}
 
-            positive_comments = [
-                'Consistently delivers high-quality work and exceeds expectations.',
-                'Great team player who actively helps others succeed.',
-                'Shows strong initiative and takes ownership of challenges.',
-                'Excellent communication skills across all levels of the organization.',
-                'Demonstrates deep expertise and shares knowledge generously.',
-                'Adapts quickly to change and handles ambiguity well.',
-                'Builds strong relationships and collaborates effectively.',
-                'Brings creative solutions to complex problems.',
-                'Mentors junior team members with patience and clarity.',
-                'Reliable and dependable - always follows through on commitments.',
-            ]
-
-            constructive_comments = [
-                'Would benefit from improving time management on large projects.',
-                'Could be more proactive in seeking feedback and clarification.',
-                'Sometimes struggles with prioritization when juggling multiple tasks.',
-                'Would benefit from more active participation in team discussions.',
-                'Could improve on delegation and trusting team members more.',
-                'Sometimes gets too focused on details at the expense of the bigger picture.',
-                'Would benefit from being more receptive to alternative approaches.',
-                'Could work on communicating progress more regularly with stakeholders.',
-                'Would benefit from developing stronger cross-functional collaboration skills.',
-                'Could improve on meeting deadlines more consistently.',
-            ]
-
             if pattern in ['high_performer', 'solid_performer']:
                 if random.random() < 0.8:
-                    return {'value': random.choice(positive_comments)}
+                    return {'value': random.choice(POSITIVE_COMMENTS)}
                 else:
-                    return {'value': random.choice(constructive_comments)}
+                    return {'value': random.choice(CONSTRUCTIVE_COMMENTS)}
             else:
                 if random.random() < 0.5:
-                    return {'value': random.choice(constructive_comments)}
+                    return {'value': random.choice(CONSTRUCTIVE_COMMENTS)}
                 else:
-                    return {'value': random.choice(positive_comments)}
+                    return {'value': random.choice(POSITIVE_COMMENTS)}
 
         elif question.question_type == 'scale':
             # Handle scale questions (e.g., 1-100)
@@ -804,18 +1006,9 @@ class Command(BaseCommand):
             scale_range = max_val - min_val
 
             # Determine scale position based on pattern
-            if pattern == 'high_performer':
-                pct = random.uniform(0.75, 0.95)
-            elif pattern == 'solid_performer':
-                pct = random.uniform(0.6, 0.85)
-            elif pattern == 'developing':
-                pct = random.uniform(0.4, 0.65)
-            elif pattern == 'imposter_syndrome':
-                pct = random.uniform(0.4, 0.6) if category == 'self' else random.uniform(0.75, 0.9)
-            elif pattern == 'overconfident':
-                pct = random.uniform(0.8, 0.95) if category == 'self' else random.uniform(0.4, 0.6)
-            else:
-                pct = random.uniform(0.5, 0.75)
+            pct = random.uniform(*_pattern_range(
+                pattern, category, SCALE_RANGES, ASYMMETRIC_SCALE_RANGES, (0.5, 0.75)
+            ))
 
             scale_value = min_val + int(scale_range * pct)
             return {'value': scale_value}
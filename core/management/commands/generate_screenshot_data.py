@@ -2,12 +2,13 @@
 Management command to generate optimized demo data specifically for screenshots.
 Creates a single organization with carefully crafted data for visual appeal.
 """
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
 from django.utils import timezone
 from accounts.models import Reviewee, UserProfile
-from accounts.permissions import assign_organization_admin, assign_organization_member
-from accounts.services import create_user_with_email_as_username
+from accounts.permissions import ensure_permission_groups
 from questionnaires.models import Questionnaire, Question
 from reviews.models import ReviewCycle, ReviewerToken, Response
 from reports.services import generate_report
@@ -15,10 +16,14 @@ from reports.models import Report
 from core.models import Organization
 import uuid
 import json
+import random
 from datetime import timedelta
 
 User = get_user_model()
 
+# Rows per INSERT statement when bulk-creating tokens and responses
+BULK_CREATE_BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = 'Generate optimized demo data for screenshots'
@@ -30,55 +35,32 @@ class Command(BaseCommand):
             help='Clear existing demo data before generating new data'
         )
 
+    # One commit for the whole run instead of one per row, and no
+    # half-generated organization if something fails midway
+    @transaction.atomic
     def handle(self, *args, **options):
         clear_existing = options['clear']
 
         if clear_existing:
             self.stdout.write('Clearing existing screenshot demo data...')
-            Response.objects.all().delete()
-            ReviewerToken.objects.all().delete()
-            ReviewCycle.objects.all().delete()
-            Reviewee.objects.all().delete()
+            # One DELETE per table, children first, instead of the ORM
+            # collecting every row to cascade. None of these models have
+            # delete signals to miss.
+            for model in (Report, Response, ReviewerToken, ReviewCycle, Reviewee):
+                queryset = model.objects.all()
+                queryset._raw_delete(queryset.db)
 
             # Delete Acme Corporation organization and its users
             acme_org = Organization.objects.filter(name='Acme Corporation').first()
             if acme_org:
-                # Delete user profiles and users for this org
-                user_profiles = UserProfile.objects.filter(organization=acme_org)
-                user_ids = list(user_profiles.values_list('user_id', flat=True))
-                user_profiles.delete()
-                User.objects.filter(id__in=user_ids).delete()
+                # Delete the org's users, selected by a join rather than a
+                # list of ids; their profiles cascade
+                User.objects.filter(profile__organization=acme_org).delete()
                 acme_org.delete()
 
             self.stdout.write(self.style.SUCCESS('Cleared existing data'))
 
-        # Create organization
-        org = Organization.objects.create(
-            name='Acme Corporation',
-            email='admin@acme.example.com',
-            min_responses_for_anonymity=3,
-            allow_registration=True,
-            default_users_can_create_cycles=False
-        )
-        self.stdout.write(self.style.SUCCESS(f'Created organization: {org.name}'))
-
-        # Create admin user with proper org admin permissions
-        admin, _ = create_user_with_email_as_username(
-            email='admin@acme.example.com',
-            password='demo123',
-            first_name='Admin',
-            last_name='User'
-        )
-        UserProfile.objects.create(
-            user=admin,
-            organization=org,
-            can_create_cycles_for_others=True
-        )
-        # Assign organization admin permissions
-        assign_organization_admin(admin)
-        self.stdout.write(self.style.SUCCESS(f'Created admin user: {admin.email} (password: demo123)'))
-
-        # Create additional team members for team page
+        # Team members for the team page; the admin user is created with them
         team_members = [
             ('Sarah', 'Johnson', 'sarah.johnson@acme.example.com', True),  # Org Admin
             ('Michael', 'Chen', 'michael.chen@acme.example.com', False),  # Member
@@ -89,25 +71,62 @@ class Command(BaseCommand):
             ('Jessica', 'Martinez', 'jessica.martinez@acme.example.com', False),
             ('Daniel', 'Taylor', 'daniel.taylor@acme.example.com', True),  # Org Admin
         ]
+        all_users = [('Admin', 'User', 'admin@acme.example.com', True)] + team_members
+
+        # Checked once up front rather than per user
+        emails = [email for _, _, email, _ in all_users]
+        if User.objects.filter(email__in=emails).exists():
+            raise CommandError('Demo users already exist; run with --clear')
 
-        for first, last, email, is_admin in team_members:
-            user, _ = create_user_with_email_as_username(
+        # Create organization
+        org = Organization.objects.create(
+            name='Acme Corporation',
+            email='admin@acme.example.com',
+            min_responses_for_anonymity=3,
+            allow_registration=True,
+            default_users_can_create_cycles=False
+        )
+        self.stdout.write(self.style.SUCCESS(f'Created organization: {org.name}'))
+
+        # Every demo user shares one password, so it is hashed once instead
+        # of once per user (the password hasher is deliberately slow)
+        password = make_password('demo123')
+        users = User.objects.bulk_create([
+            User(
+                username=email,
                 email=email,
-                password='demo123',
                 first_name=first,
-                last_name=last
+                last_name=last,
+                password=password,
+                is_staff=is_admin  # as assign_organization_admin/member set it
             )
+            for first, last, email, is_admin in all_users
+        ])
+        if not connection.features.can_return_rows_from_bulk_insert:
+            # Backends that cannot return inserted rows leave pk unset; look the
+            # users up by their (unique) username instead
+            by_username = User.objects.in_bulk(emails, field_name='username')
+            users = [by_username[email] for email in emails]
+        admin = users[0]
+
+        # Profiles are saved one by one: their post_save creates the
+        # matching reviewee
+        for user, (first, last, email, is_admin) in zip(users, all_users):
             UserProfile.objects.create(
                 user=user,
                 organization=org,
                 can_create_cycles_for_others=is_admin
             )
-            # Assign proper permissions
-            if is_admin:
-                assign_organization_admin(user)
-            else:
-                assign_organization_member(user, can_create_cycles_for_others=False)
 
+        # Assign proper permissions: the group memberships
+        # assign_organization_admin/member grant, added per group rather
+        # than per user
+        admin_group, member_group = ensure_permission_groups()
+        is_admin_flags = [is_admin for _, _, _, is_admin in all_users]
+        admin_group.user_set.add(*[user for user, is_admin in zip(users, is_admin_flags) if is_admin])
+        member_group.user_set.add(*[user for user, is_admin in zip(users, is_admin_flags) if not is_admin])
+
+        self.stdout.write(self.style.SUCCESS(f'Created admin user: {admin.email} (password: demo123)'))
         self.stdout.write(self.style.SUCCESS(f'Created {len(team_members)} team members'))
 
         # Get all questionnaires for the organization
@@ -118,13 +137,18 @@ class Command(BaseCommand):
             "360 Degree Feedback"
         ]
 
+        # One query for all names; the first match per name wins, as .first() would
+        by_name = {}
+        for q in Questionnaire.objects.filter(
+            organization=org,
+            name__in=questionnaires_to_use,
+            is_active=True
+        ):
+            by_name.setdefault(q.name, q)
+
         questionnaires = {}
         for q_name in questionnaires_to_use:
-            q = Questionnaire.objects.filter(
-                organization=org,
-                name=q_name,
-                is_active=True
-            ).first()
+            q = by_name.get(q_name)
             if q:
                 questionnaires[q_name] = q
             else:
@@ -137,6 +161,13 @@ class Command(BaseCommand):
             ))
             return
 
+        # Questions per questionnaire, loaded in one query for all cycles
+        questions_by_questionnaire = {q.id: [] for q in questionnaires.values()}
+        for question in Question.objects.filter(
+            section__questionnaire__in=questionnaires.values()
+        ).select_related('section').order_by('section__order', 'order'):
+            questions_by_questionnaire[question.section.questionnaire_id].append(question)
+
         # Create completed reviewees with different questionnaires
         reviewees_data = [
             ('Alex Rivera', 'alex.rivera@acme.example.com', 'Engineering', 'Professional Skills 360 Review'),
@@ -170,7 +201,9 @@ class Command(BaseCommand):
             )
 
             questionnaire = questionnaires[questionnaire_name]
-            cycle = self._create_completed_cycle(reviewee, questionnaire, admin)
+            cycle = self._create_completed_cycle(
+                reviewee, questionnaire, questions_by_questionnaire[questionnaire.id], admin
+            )
 
             cycle_data = {
                 'reviewee': name,
@@ -199,7 +232,10 @@ class Command(BaseCommand):
 
             if cycle_type.startswith('partial_'):
                 completion_pct = int(cycle_type.split('_')[1])
-                cycle = self._create_partial_cycle(reviewee, default_questionnaire, admin, completion_pct)
+                cycle = self._create_partial_cycle(
+                    reviewee, default_questionnaire, questions_by_questionnaire[default_questionnaire.id],
+                    admin, completion_pct
+                )
                 cycles_output.append({
                     'reviewee': name,
                     'questionnaire': default_questionnaire.name,
@@ -232,12 +268,16 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS(f'Created {len(cycles_output)} review cycles'))
 
-        # Get report access tokens for all completed cycles
+        # Get report access tokens for all completed cycles, fetching only
+        # that column rather than the full report data
+        access_tokens = dict(Report.objects.filter(
+            cycle_id__in=[cycle_data['cycle_id'] for cycle_data in questionnaire_cycles.values()]
+        ).values_list('cycle_id', 'access_token'))
         report_tokens = {}
         for q_key, cycle_data in questionnaire_cycles.items():
-            report = Report.objects.filter(cycle_id=cycle_data['cycle_id']).first()
-            if report and report.access_token:
-                report_tokens[q_key] = str(report.access_token)
+            access_token = access_tokens.get(cycle_data['cycle_id'])
+            if access_token:
+                report_tokens[q_key] = str(access_token)
 
         # Find partial cycle for screenshots
         partial_cycle = next((c for c in cycles_output if c.get('completion')), None)
@@ -270,7 +310,7 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS('\nConfiguration saved to: /tmp/blik_screenshot_config.json'))
 
-    def _create_completed_cycle(self, reviewee, questionnaire, admin_user):
+    def _create_completed_cycle(self, reviewee, questionnaire, questions, admin_user):
         """Create a completed cycle with visually interesting data"""
         cycle = ReviewCycle.objects.create(
             reviewee=reviewee,
@@ -287,28 +327,30 @@ class Command(BaseCommand):
             ('direct_report', 2),
         ]
 
+        completed_time = timezone.now() - timedelta(days=7)
         tokens = []
         for category, count in token_configs:
             for _ in range(count):
-                completed_time = timezone.now() - timedelta(days=7)
-                token = ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4(),
                     claimed_at=completed_time - timedelta(hours=24),
                     completed_at=completed_time
-                )
-                tokens.append(token)
-
-        # Get questions
-        questions = list(Question.objects.filter(
-            section__questionnaire=questionnaire
-        ).order_by('section__order', 'order'))
+                ))
+        tokens = self._bulk_create_tokens(tokens)
+
+        # Per-question seeds and config are the same for every token, so
+        # work them out once
+        question_seeds = [
+            (question, question.config or {}, hash(question.id) % 10, hash(question.id) % 3 == 0)
+            for question in questions
+        ]
 
         # Create responses with differentiated patterns by category
+        responses = []
         for token in tokens:
-            for question in questions:
-                question_seed = hash(question.id) % 10
+            for question, config, question_seed, has_comment in question_seeds:
 
                 if question.question_type in ['rating', 'likert']:
                     # Create realistic differentiation between categories
@@ -336,7 +378,6 @@ class Command(BaseCommand):
 
                 elif question.question_type == 'scale':
                     # Scale questions (e.g., 1-100)
-                    config = question.config or {}
                     min_val = config.get('min', 1)
                     max_val = config.get('max', 100)
                     scale_range = max_val - min_val
@@ -360,7 +401,6 @@ class Command(BaseCommand):
 
                 elif question.question_type == 'single_choice':
                     # Single choice questions - select based on weights if available
-                    config = question.config or {}
                     choices = config.get('choices', [])
                     weights = config.get('weights', [])
 
@@ -385,7 +425,6 @@ class Command(BaseCommand):
 
                 elif question.question_type == 'multiple_choice':
                     # Multiple choice questions - select multiple options
-                    config = question.config or {}
                     choices = config.get('choices', [])
 
                     if choices:
@@ -398,49 +437,49 @@ class Command(BaseCommand):
                             # Peers/reports select more options
                             num_selections = min(len(choices), num_selections + 1)
 
-                        # Select distinct options
-                        selected = []
-                        for i in range(min(num_selections, len(choices))):
-                            idx = (question_seed + i * 7) % len(choices)
-                            if choices[idx] not in selected:
-                                selected.append(choices[idx])
+                        # Select distinct options, deterministic per token/question
+                        rng = random.Random(hash((token.id, question.id)))
+                        selected = rng.sample(choices, min(num_selections, len(choices)))
                         answer_data = {'value': selected}
                     else:
                         answer_data = {'value': []}
 
                 elif question.question_type == 'text':
                     # Add some text comments
-                    if token.category != 'self' and hash(question.id) % 3 == 0:
+                    if token.category != 'self' and has_comment:
                         comments = [
                             'Consistently delivers high-quality work and exceeds expectations.',
                             'Excellent communication skills and great team collaboration.',
                             'Shows strong technical expertise and helps others grow.',
                             'Could be more confident in presenting ideas to leadership.',
                         ]
-                        answer_data = {'value': comments[hash(str(token.id) + str(question.id)) % len(comments)]}
+                        answer_data = {'value': comments[hash((token.id, question.id)) % len(comments)]}
                     else:
                         answer_data = {'value': ''}
                 else:
                     answer_data = {'value': ''}
 
-                Response.objects.create(
+                responses.append(Response(
                     cycle=cycle,
                     question=question,
                     token=token,
                     category=token.category,
                     answer_data=answer_data
-                )
+                ))
+        Response.objects.bulk_create(responses, batch_size=BULK_CREATE_BATCH_SIZE)
 
         # Generate report
         try:
-            generate_report(cycle)
+            # Savepoint, so a database error here doesn't abort the seed transaction
+            with transaction.atomic():
+                generate_report(cycle)
             self.stdout.write(self.style.SUCCESS(f'Generated report for {reviewee.name}'))
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Could not generate report: {e}'))
 
         return cycle
 
-    def _create_partial_cycle(self, reviewee, questionnaire, admin_user, completion_pct):
+    def _create_partial_cycle(self, reviewee, questionnaire, questions, admin_user, completion_pct):
         """Create a partially completed cycle"""
         cycle = ReviewCycle.objects.create(
             reviewee=reviewee,
@@ -455,71 +494,81 @@ class Command(BaseCommand):
         # Create tokens
         categories = ['self'] + ['manager'] * 3 + ['peer'] * 4 + ['direct_report'] * 2
 
+        now = timezone.now()
+        tokens = []
         for i, category in enumerate(categories):
             if i < completed_tokens:
                 # Completed
-                token = ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4(),
-                    claimed_at=timezone.now() - timedelta(days=10),
-                    completed_at=timezone.now() - timedelta(days=5)
-                )
-                # Add responses
-                questions = list(Question.objects.filter(
-                    section__questionnaire=questionnaire
-                ).order_by('section__order', 'order'))
-
-                for question in questions:
-                    if question.question_type in ['rating', 'likert']:
-                        answer_data = {'value': 4}
-                    elif question.question_type == 'scale':
-                        config = question.config or {}
-                        min_val = config.get('min', 1)
-                        max_val = config.get('max', 100)
-                        scale_range = max_val - min_val
-                        answer_data = {'value': min_val + int(scale_range * 0.7)}
-                    elif question.question_type == 'single_choice':
-                        config = question.config or {}
-                        choices = config.get('choices', [])
-                        if choices:
-                            answer_data = {'value': choices[len(choices) // 2]}
-                        else:
-                            answer_data = {'value': ''}
-                    elif question.question_type == 'multiple_choice':
-                        config = question.config or {}
-                        choices = config.get('choices', [])
-                        if choices:
-                            # Select 2 options from middle
-                            selected = [choices[i] for i in range(min(2, len(choices)))]
-                            answer_data = {'value': selected}
-                        else:
-                            answer_data = {'value': []}
-                    else:
-                        answer_data = {'value': ''}
-
-                    Response.objects.create(
-                        cycle=cycle,
-                        question=question,
-                        token=token,
-                        category=category,
-                        answer_data=answer_data
-                    )
+                    claimed_at=now - timedelta(days=10),
+                    completed_at=now - timedelta(days=5)
+                ))
             elif i < completed_tokens + 2:
                 # Claimed but not completed
-                ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4(),
-                    claimed_at=timezone.now() - timedelta(days=3)
-                )
+                    claimed_at=now - timedelta(days=3)
+                ))
             else:
                 # Not claimed
-                ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4()
-                )
+                ))
+        tokens = self._bulk_create_tokens(tokens)
+
+        # Partial-cycle answers do not depend on the reviewer, so each
+        # question's answer is worked out once and shared by every token
+        answers = []
+        for question in questions:
+            if question.question_type in ['rating', 'likert']:
+                answer_data = {'value': 4}
+            elif question.question_type == 'scale':
+                config = question.config or {}
+                min_val = config.get('min', 1)
+                max_val = config.get('max', 100)
+                scale_range = max_val - min_val
+                answer_data = {'value': min_val + int(scale_range * 0.7)}
+            elif question.question_type == 'single_choice':
+                config = question.config or {}
+                choices = config.get('choices', [])
+                if choices:
+                    answer_data = {'value': choices[len(choices) // 2]}
+                else:
+                    answer_data = {'value': ''}
+            elif question.question_type == 'multiple_choice':
+                config = question.config or {}
+                choices = config.get('choices', [])
+                if choices:
+                    # Select 2 options from middle
+                    selected = [choices[i] for i in range(min(2, len(choices)))]
+                    answer_data = {'value': selected}
+                else:
+                    answer_data = {'value': []}
+            else:
+                answer_data = {'value': ''}
+
+            answers.append((question, answer_data))
+
+        # Add responses for the completed tokens
+        responses = [
+            Response(
+                cycle=cycle,
+                question=question,
+                token=token,
+                category=token.category,
+                answer_data=answer_data
+            )
+            for token in tokens[:completed_tokens]
+            for question, answer_data in answers
+        ]
+        Response.objects.bulk_create(responses, batch_size=BULK_CREATE_BATCH_SIZE)
 
         return cycle
 
@@ -537,19 +586,33 @@ class Command(BaseCommand):
 
         categories = ['self'] + ['manager'] * 3 + ['peer'] * 4 + ['direct_report'] * 2
 
+        claimed_time = timezone.now() - timedelta(days=1)
+        tokens = []
         for i, category in enumerate(categories):
             if i < claimed_tokens:
-                ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4(),
-                    claimed_at=timezone.now() - timedelta(days=1)
-                )
+                    claimed_at=claimed_time
+                ))
             else:
-                ReviewerToken.objects.create(
+                tokens.append(ReviewerToken(
                     cycle=cycle,
                     category=category,
                     token=uuid.uuid4()
-                )
+                ))
+        ReviewerToken.objects.bulk_create(tokens, batch_size=BULK_CREATE_BATCH_SIZE)
 
         return cycle
+
+    def _bulk_create_tokens(self, tokens):
+        """Insert a cycle's tokens in one statement and return them with primary keys set"""
+        created = ReviewerToken.objects.bulk_create(tokens, batch_size=BULK_CREATE_BATCH_SIZE)
+        if connection.features.can_return_rows_from_bulk_insert:
+            return created
+
+        # Backends that cannot return inserted rows leave pk unset; look the
+        # tokens up by their (unique) token UUID instead
+        by_token = ReviewerToken.objects.in_bulk([t.token for t in tokens], field_name='token')
+        return [by_token[t.token] for t in tokens]
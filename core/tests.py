@@ -1,3 +1,237 @@
+from io import StringIO
+from unittest import mock, skipIf, skipUnless
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from accounts.factories import RevieweeFactory
+from accounts.models import Reviewee
+from questionnaires.factories import QuestionnaireFactory, QuestionSectionFactory, QuestionFactory
+from reports.models import Report
+from reviews.factories import ReviewCycleFactory, ReviewerTokenFactory, ResponseFactory
+from reviews.models import ReviewCycle, ReviewerToken, Response
+from core.factories import OrganizationFactory, UserFactory
+from core.gdpr import GDPRDeletionService
+from core.management.commands.generate_demo_data import Command as GenerateDemoDataCommand
+
+
+@skipUnless(connection.vendor == 'postgresql', 'COPY FROM STDIN is only used on PostgreSQL')
+class DemoDataCopyTestCase(TestCase):
+    """Test that generate_demo_data's COPY path stores the same rows as bulk_create"""
+
+    def setUp(self):
+        self.questionnaire = QuestionnaireFactory()
+        section = QuestionSectionFactory(questionnaire=self.questionnaire)
+        self.rating_question = QuestionFactory(section=section)
+        self.text_question = QuestionFactory(section=section, question_type='text', config={})
+
+    def _flush(self):
+        """Queue tokens and responses for a new cycle, flush them and return the stored rows"""
+        cycle = ReviewCycleFactory(questionnaire=self.questionnaire)
+        command = GenerateDemoDataCommand()
+        command._pending_tokens = [
+            ReviewerToken(cycle=cycle, category=category)
+            for category in ('self', 'peer', 'manager')
+        ]
+        command._pending_responses = []
+        for token in command._pending_tokens:
+            command._pending_responses += [
+                (cycle, self.rating_question, token, {'value': 4}),
+                # Characters COPY has to escape
+                (cycle, self.text_question, token, {'value': 'Tab\there, "quoted" \\ naïve\nsecond line'}),
+            ]
+        command._flush_pending_rows()
+
+        tokens = list(
+            ReviewerToken.objects.filter(cycle=cycle).order_by('category').values_list('category', flat=True)
+        )
+        responses = list(
+            Response.objects.filter(cycle=cycle)
+            .order_by('token__category', 'question_id')
+            .values_list('token__category', 'question_id', 'category', 'answer_data')
+        )
+        return tokens, responses
+
+    def test_copy_matches_bulk_create(self):
+        """Test that responses loaded with COPY equal those inserted with bulk_create"""
+        copied = self._flush()
+        with mock.patch.object(
+            GenerateDemoDataCommand, '_copy_responses', GenerateDemoDataCommand._bulk_create_responses
+        ):
+            bulk_created = self._flush()
+
+        self.assertEqual(len(copied[1]), 6)
+        self.assertEqual(copied, bulk_created)
+
+
+class RevieweeDeletionTestCase(TestCase):
+    """Base class with two reviewees that both have cycles, tokens, responses and reports"""
+
+    def setUp(self):
+        self.org = OrganizationFactory()
+        self.admin = UserFactory()
+        self.questionnaire = QuestionnaireFactory(organization=self.org)
+        section = QuestionSectionFactory(questionnaire=self.questionnaire)
+        self.questions = [QuestionFactory(section=section) for _ in range(2)]
+
+        # 2 cycles, 6 tokens, 12 responses and 2 reports
+        self.reviewee = RevieweeFactory(organization=self.org)
+        for _ in range(2):
+            self._create_cycle(self.reviewee)
+
+        # 1 cycle, 3 tokens, 6 responses and 1 report
+        self.other_reviewee = RevieweeFactory(organization=self.org)
+        self._create_cycle(self.other_reviewee)
+
+    def _create_cycle(self, reviewee):
+        """Create a cycle with 3 answered tokens and a report"""
+        cycle = ReviewCycleFactory(
+            reviewee=reviewee, questionnaire=self.questionnaire, created_by=self.admin
+        )
+        for category in ('self', 'peer', 'manager'):
+            token = ReviewerTokenFactory(cycle=cycle, category=category)
+            for question in self.questions:
+                ResponseFactory(cycle=cycle, question=question, token=token)
+        Report.objects.create(cycle=cycle, report_data={})
+        return cycle
+
+    def _review_data_counts(self, reviewee):
+        """Count the rows that belong to a reviewee in every review table"""
+        return {
+            'cycles': ReviewCycle.objects.filter(reviewee=reviewee).count(),
+            'tokens': ReviewerToken.objects.filter(cycle__reviewee=reviewee).count(),
+            'responses': Response.objects.filter(cycle__reviewee=reviewee).count(),
+            'reports': Report.objects.filter(cycle__reviewee=reviewee).count(),
+        }
+
+    def assertRevieweeDeleted(self, reviewee):
+        """Assert the reviewee and all of its review data are gone"""
+        self.assertFalse(Reviewee.objects.filter(pk=reviewee.pk).exists())
+        self.assertEqual(
+            self._review_data_counts(reviewee),
+            {'cycles': 0, 'tokens': 0, 'responses': 0, 'reports': 0}
+        )
+
+    def assertOtherRevieweeIntact(self):
+        """Assert the other reviewee still has all of its review data"""
+        self.assertTrue(Reviewee.objects.filter(pk=self.other_reviewee.pk).exists())
+        self.assertEqual(
+            self._review_data_counts(self.other_reviewee),
+            {'cycles': 1, 'tokens': 3, 'responses': 6, 'reports': 1}
+        )
+
+
+class RevieweeHardDeleteTestCase(RevieweeDeletionTestCase):
+    """Test hard deleting a reviewee with set-based DELETEs"""
+
+    def test_hard_delete_removes_review_data(self):
+        """Test that the reviewee, its cycles, tokens, responses and reports are deleted"""
+        GDPRDeletionService.delete_reviewee(self.reviewee.pk, hard_delete=True)
+
+        self.assertRevieweeDeleted(self.reviewee)
+
+    def test_hard_delete_keeps_other_reviewees_data(self):
+        """Test that another reviewee's review data is untouched"""
+        GDPRDeletionService.delete_reviewee(self.reviewee.pk, hard_delete=True)
+
+        self.assertOtherRevieweeIntact()
+
+    def test_hard_delete_result_counts(self):
+        """Test that the result reports the rows deleted per table"""
+        result = GDPRDeletionService.delete_reviewee(self.reviewee.pk, hard_delete=True)
+
+        self.assertEqual(result['status'], 'deleted')
+        self.assertEqual(result['review_cycles_affected'], 2)
+        self.assertEqual(result['deleted_counts'], {
+            'reports': 2,
+            'responses': 12,
+            'reviewer_tokens': 6,
+            'review_cycles': 2,
+            'reviewees': 1,
+        })
+
+    def test_hard_delete_is_audit_logged(self):
+        """Test that the deletion is written to the audit log"""
+        with self.assertLogs('core.gdpr', level='INFO') as logs:
+            GDPRDeletionService.delete_reviewee(self.reviewee.pk, hard_delete=True)
+
+        audit = [line for line in logs.output if 'GDPR Deletion' in line]
+        self.assertEqual(len(audit), 1)
+        self.assertIn("'entity_type': 'Reviewee'", audit[0])
+        self.assertIn(f"'entity_id': {self.reviewee.pk}", audit[0])
+        self.assertIn("'deletion_type': 'hard'", audit[0])
+
+
+class RevieweeChunkedHardDeleteTestCase(RevieweeDeletionTestCase):
+    """Test hard deleting a reviewee a bounded number of rows at a time"""
+
+    def _delete_in_chunks(self, chunk_size):
+        """Hard delete with chunk_size and check exactly the reviewee's data is removed"""
+        result = GDPRDeletionService.delete_reviewee(
+            self.reviewee.pk, hard_delete=True, chunk_size=chunk_size
+        )
+
+        self.assertRevieweeDeleted(self.reviewee)
+        self.assertOtherRevieweeIntact()
+        self.assertEqual(result['deleted_counts'], {
+            'reports': 2,
+            'responses': 12,
+            'reviewer_tokens': 6,
+            'review_cycles': 2,
+            'reviewees': 1,
+        })
+
+    def test_chunk_size_one(self):
+        """Test deleting one row per statement"""
+        self._delete_in_chunks(1)
+
+    def test_chunk_size_dividing_row_counts(self):
+        """Test a chunk size that divides the row counts evenly, so the last chunk is full"""
+        self._delete_in_chunks(2)
+
+    def test_chunk_size_larger_than_row_counts(self):
+        """Test a chunk size that fits every table in a single chunk"""
+        self._delete_in_chunks(100)
+
+
+class RevieweePurgeTestCase(RevieweeDeletionTestCase):
+    """Test hard deleting a reviewee with --purge-org"""
+
+    def test_purge_org_command_keeps_other_reviewees_data(self):
+        """Test that --purge-org falls back to a normal hard delete when others own cycles"""
+        call_command(
+            'gdpr_delete_reviewee', str(self.reviewee.pk), '--hard', '--purge-org', '--yes',
+            stdout=StringIO()
+        )
+
+        self.assertRevieweeDeleted(self.reviewee)
+        self.assertOtherRevieweeIntact()
+
+    @skipIf(connection.vendor == 'postgresql', 'Tests the fallback for databases without TRUNCATE')
+    def test_purge_falls_back_without_postgresql(self):
+        """Test that a sole owner is hard deleted normally when TRUNCATE is unavailable"""
+        GDPRDeletionService.delete_reviewee(self.other_reviewee.pk, hard_delete=True)
+
+        result = GDPRDeletionService.delete_reviewee(self.reviewee.pk, hard_delete=True, purge=True)
+
+        self.assertFalse(result['truncated'])
+        self.assertEqual(result['deleted_counts']['responses'], 12)
+        self.assertRevieweeDeleted(self.reviewee)
+
+    @skipUnless(connection.vendor == 'postgresql', 'TRUNCATE is only used on PostgreSQL')
+    def test_truncate_refused_when_another_reviewee_owns_a_cycle(self):
+        """Test that the review tables are not truncated while another reviewee owns a cycle"""
+        self.assertFalse(GDPRDeletionService._truncate_review_data_if_sole_owner(self.reviewee.pk))
+
+        self.assertEqual(self._review_data_counts(self.reviewee)['responses'], 12)
+        self.assertOtherRevieweeIntact()
+
+    @skipUnless(connection.vendor == 'postgresql', 'TRUNCATE is only used on PostgreSQL')
+    def test_purge_truncates_for_sole_owner(self):
+        """Test that the review tables are truncated when the reviewee owns every cycle"""
+        GDPRDeletionService.delete_reviewee(self.other_reviewee.pk, hard_delete=True)
+
+        result = GDPRDeletionService.delete_reviewee(self.reviewee.pk, hard_delete=True, purge=True)
 
-# Create your tests here.
+        self.assertTrue(result['truncated'])
+        self.assertRevieweeDeleted(self.reviewee)
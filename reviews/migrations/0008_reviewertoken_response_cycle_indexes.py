@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionnaires', '0016_fix_agency_questionnaire_template_status'),
+        ('reviews', '0007_reviewcycle_close_check_sent_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='response',
+            index=models.Index(fields=['cycle', 'question'], name='responses_cycle_i_64faa3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewertoken',
+            index=models.Index(fields=['cycle', 'category'], name='reviewer_to_cycle_i_b6e12b_idx'),
+        ),
+    ]
@@ -131,6 +131,9 @@ class ReviewerToken(TimeStampedModel):
     class Meta:
         db_table = 'reviewer_tokens'
         ordering = ['cycle', 'category']
+        indexes = [
+            models.Index(fields=['cycle', 'category']),
+        ]
 
     def __str__(self):
         return f"{self.cycle} - {self.get_category_display()}"
@@ -174,6 +177,9 @@ class Response(TimeStampedModel):
         db_table = 'responses'
         ordering = ['cycle', 'question']
         unique_together = ['token', 'question']
+        indexes = [
+            models.Index(fields=['cycle', 'question']),
+        ]
 
     def __str__(self):
         return f"{self.cycle} - {self.question.question_text[:30]}"